@@ -0,0 +1,42 @@
+"""
+Pytest configuration for the MIKE-1 engine tests.
+
+Puts src/ on the path and imports the modules the tests exercise once per
+session, so collection (and each xdist worker) pays the import cost up front.
+
+Wall-clock tests are marked perf and skipped unless --run-perf is given.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+try:
+    import mike1.modules.judge  # noqa: F401
+    import mike1.modules.social  # noqa: F401
+except ImportError:
+    pass  # Test modules that need these will report the real error
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-perf", action="store_true", default=False,
+        help="run wall-clock performance tests (marked perf)"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: wall-clock timing test, opt-in with --run-perf")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-perf"):
+        return
+
+    skip_perf = pytest.mark.skip(reason="timing test - pass --run-perf to run")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
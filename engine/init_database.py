@@ -11,6 +11,7 @@ load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 def init_database():
     """Create all tables in NeonDB."""
     import psycopg2
+    from psycopg2 import sql
 
     database_url = os.getenv("DATABASE_URL")
 
@@ -33,11 +34,13 @@ def init_database():
 
     try:
         conn = psycopg2.connect(database_url)
-        conn.autocommit = True
         cursor = conn.cursor()
 
+        # Whole schema in one round trip and one transaction. Not split on ';'
+        # - the trigger function body is $$-quoted and contains semicolons.
         print("Executing schema...")
         cursor.execute(schema_sql)
+        conn.commit()
 
         print("SUCCESS: Database schema created!")
 
@@ -50,12 +53,19 @@ def init_database():
             ORDER BY table_name;
         """)
 
-        tables = cursor.fetchall()
+        tables = [row[0] for row in cursor.fetchall()]
         print(f"\nTables created ({len(tables)}):")
-        for table in tables:
-            cursor.execute(f"SELECT COUNT(*) FROM {table[0]}")
-            count = cursor.fetchone()[0]
-            print(f"  - {table[0]}: {count} rows")
+        if tables:
+            # Row counts for every table in a single query
+            count_query = sql.SQL(" UNION ALL ").join([
+                sql.SQL("SELECT {name}, COUNT(*) FROM {table}").format(
+                    name=sql.Literal(table), table=sql.Identifier(table)
+                )
+                for table in tables
+            ])
+            cursor.execute(count_query)
+            for table, count in cursor.fetchall():
+                print(f"  - {table}: {count} rows")
 
         # Verify views exist
         cursor.execute("""
@@ -10,6 +10,7 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
 import os
 from pathlib import Path
@@ -31,9 +32,11 @@ structlog.configure(
         structlog.processors.add_log_level,
         structlog.dev.ConsoleRenderer(colors=True)
     ],
-    wrapper_class=structlog.make_filtering_bound_logger(20),  # INFO level
+    # Below-threshold calls are no-op methods, so they skip the processor chain
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
     context_class=dict,
     logger_factory=structlog.PrintLoggerFactory(),
+    cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger()
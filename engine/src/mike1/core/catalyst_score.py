@@ -0,0 +1,109 @@
+"""
+Batch Catalyst Scoring for MIKE-1.
+
+Scores many LLM catalyst assessments at once (e.g. replaying a day of
+Gemini output). Same rules as the per-response score:
+
+- No catalyst: 5 (neutral)
+- Catalyst: 7, then
+  - sentiment aligned with direction: +3 at confidence >= 0.8, +1 at >= 0.5
+  - misaligned, non-neutral sentiment at confidence >= 0.6: -1
+- Clamped to 0-10
+
+Categoricals are integer-encoded so the loop can be compiled with numba.
+Without numba the same function runs as plain Python.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+from ..utils.jit import HAS_NUMBA, njit
+
+
+# Sentiment codes
+SENT_NEUTRAL = 0
+SENT_BULL = 1
+SENT_BEAR = 2
+SENT_OTHER = 3  # Unrecognized label - treated as non-neutral, never aligned
+
+# Direction codes
+DIR_OTHER = 0
+DIR_CALL = 1
+DIR_PUT = 2
+
+SENTIMENT_CODES = {"neutral": SENT_NEUTRAL, "bullish": SENT_BULL, "bearish": SENT_BEAR}
+DIRECTION_CODES = {"call": DIR_CALL, "put": DIR_PUT}
+
+# Explicit signature: numba compiles at import (and reuses the on-disk cache)
+# instead of on the first call. Inputs must match these dtypes exactly.
+SCORE_BATCH_SIGNATURE = "float32[:](int8[:], int8[:], float32[:], boolean[:])"
+
+
+@njit(SCORE_BATCH_SIGNATURE, cache=True)
+def score_batch(sentiments, directions, confidences, has_catalyst):
+    """
+    Score encoded catalyst assessments.
+
+    Args:
+        sentiments: int8 array of SENT_* codes
+        directions: int8 array of DIR_* codes
+        confidences: float32 array of LLM confidence
+        has_catalyst: bool array
+
+    Returns:
+        float32 array of catalyst scores (0-10)
+    """
+    n = sentiments.shape[0]
+    out = np.empty(n, dtype=np.float32)
+
+    for i in range(n):
+        if not has_catalyst[i]:
+            out[i] = 5.0
+            continue
+
+        score = 7.0
+        sentiment = sentiments[i]
+        direction = directions[i]
+        confidence = confidences[i]
+
+        if (sentiment == SENT_BULL and direction == DIR_CALL) or (
+            sentiment == SENT_BEAR and direction == DIR_PUT
+        ):
+            if confidence >= 0.8:
+                score += 3.0
+            elif confidence >= 0.5:
+                score += 1.0
+        elif sentiment != SENT_NEUTRAL and confidence >= 0.6:
+            score -= 1.0
+
+        out[i] = min(10.0, max(0.0, score))
+
+    return out
+
+
+def encode_responses(
+    responses: Sequence[dict],
+    directions: Sequence[str]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Encode LLM responses and trade directions into score_batch inputs.
+
+    Returns:
+        (sentiments, directions, confidences, has_catalyst) arrays
+    """
+    n = len(responses)
+    return (
+        np.fromiter(
+            (SENTIMENT_CODES.get(r.get("sentiment", "neutral"), SENT_OTHER) for r in responses),
+            dtype=np.int8, count=n
+        ),
+        np.fromiter((DIRECTION_CODES.get(d, DIR_OTHER) for d in directions), dtype=np.int8, count=n),
+        np.fromiter((r.get("confidence", 0) for r in responses), dtype=np.float32, count=n),
+        np.fromiter((bool(r.get("has_catalyst", False)) for r in responses), dtype=np.bool_, count=n),
+    )
+
+
+def score_responses(responses: Sequence[dict], directions: Sequence[str]) -> np.ndarray:
+    """Score LLM responses against their trade directions in one batch."""
+    return score_batch(*encode_responses(responses, directions))
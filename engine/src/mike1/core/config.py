@@ -233,6 +233,11 @@ class CuratorConfig(BaseModel):
     cache_chain_seconds: int = 60
 
 
+class ScoutConfig(BaseModel):
+    """Scout (signal detection) settings."""
+    max_workers: int = 8  # Tickers scanned concurrently (broker I/O bound)
+
+
 class EngineConfig(BaseModel):
     """Engine runtime settings."""
     poll_interval: int = 30
@@ -255,6 +260,7 @@ class Config(BaseModel):
     risk: RiskConfig = Field(default_factory=RiskConfig)
     exits: ExitConfig = Field(default_factory=ExitConfig)
     options: OptionsConfig = Field(default_factory=OptionsConfig)
+    scout: ScoutConfig = Field(default_factory=ScoutConfig)
     curator: CuratorConfig = Field(default_factory=CuratorConfig)
     scoring: ScoringConfig = Field(default_factory=ScoringConfig)
     reentry: ReentryConfig = Field(default_factory=ReentryConfig)
@@ -7,7 +7,7 @@ Tracks open positions, high water marks, and exit states.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional, Sequence
 from zoneinfo import ZoneInfo
 
 
@@ -29,6 +29,27 @@ class OptionType(Enum):
     PUT = "put"
 
 
+@dataclass
+class PriceReplay:
+    """
+    Per-tick metrics for a price series, computed in one vectorized pass.
+
+    Produced by Position.replay(). All arrays line up with `prices`.
+    """
+    prices: Any                                # np.ndarray of option prices
+    high_water_mark: Any                       # Running max (starting from the position's HWM)
+    pnl_percent: Any                           # P&L % vs entry at each tick
+    high_water_pnl_percent: Any                # HWM P&L % at each tick
+    drawdown: Any                              # HWM P&L % minus P&L % (points)
+
+    def first_index(self, mask: Any) -> Optional[int]:
+        """Index of the first True in a boolean array, or None."""
+        if not len(mask):
+            return None
+        idx = int(mask.argmax())
+        return idx if mask[idx] else None
+
+
 @dataclass
 class Position:
     """
@@ -119,6 +140,44 @@ class Position:
         cost_basis = self.entry_price * self.contracts_remaining * 100
         self.unrealized_pnl = self.current_value - cost_basis
 
+    def replay(self, prices: Sequence[float]) -> PriceReplay:
+        """
+        Run a whole price series through the position at once.
+
+        Equivalent to calling update_price() for each price, but the
+        high water mark and P&L series come from NumPy in one pass.
+        Leaves the position in the same final state.
+
+        Use the returned arrays to find triggers, e.g.
+        replay.first_index(replay.pnl_percent >= trim_1_pct).
+        """
+        import numpy as np
+
+        prices = np.asarray(prices, dtype=np.float64)
+        hwm = np.maximum.accumulate(np.maximum(prices, self.high_water_mark))
+
+        if self.entry_price == 0:
+            pnl_pct = np.zeros_like(prices)
+            hwm_pct = np.zeros_like(prices)
+        else:
+            pnl_pct = (prices / self.entry_price - 1) * 100
+            hwm_pct = (hwm / self.entry_price - 1) * 100
+
+        if len(prices):
+            peak = float(hwm[-1])
+            if peak > self.high_water_mark:
+                self.high_water_mark = peak
+                self.high_water_time = datetime.now()
+            self.update_price(float(prices[-1]))
+
+        return PriceReplay(
+            prices=prices,
+            high_water_mark=hwm,
+            pnl_percent=pnl_pct,
+            high_water_pnl_percent=hwm_pct,
+            drawdown=hwm_pct - pnl_pct,
+        )
+
     @property
     def pnl_percent(self) -> float:
         """Current P&L as percentage of entry."""
@@ -201,10 +201,10 @@ class Engine:
         # Log any actions taken
         for action in actions:
             self.logger.log_action(
-                action_type=action.get("type"),
-                position_id=action.get("position_id"),
-                ticker=action.get("ticker"),
-                details=action,
+                action_type=action.type,
+                position_id=action.position_id,
+                ticker=action.ticker,
+                details=action.to_dict(),
                 dry_run=self.dry_run
             )
 
@@ -216,6 +216,7 @@ class Engine:
         self.logger.log_system_event("engine_stop", {
             "governor_status": self.governor.get_status()
         })
+        self.logger.close()
 
         self.disconnect()
 
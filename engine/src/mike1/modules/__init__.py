@@ -1,6 +1,6 @@
 """MIKE-1 modules."""
 
-from .executor import Executor
+from .executor import Executor, ExitAction
 from .broker import Broker, PaperBroker
 from .broker_alpaca import AlpacaBroker
 from .broker_factory import BrokerFactory, FailoverBroker
@@ -10,6 +10,7 @@ from .llm_client import GeminiClient, get_llm_client
 
 __all__ = [
     "Executor",
+    "ExitAction",
     "Broker",
     "PaperBroker",
     "AlpacaBroker",
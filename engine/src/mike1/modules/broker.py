@@ -7,7 +7,8 @@ Base broker interface and Paper broker for testing.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from itertools import islice
+from typing import Iterator, Optional
 import structlog
 
 logger = structlog.get_logger()
@@ -162,6 +163,49 @@ class Broker(ABC):
         """Get RSI."""
         return 50.0
 
+    def get_snapshot(self, symbol: str) -> Optional[dict]:
+        """
+        Get price, volume, VWAP and RSI for a symbol in one call.
+
+        Default implementation stitches the individual getters together.
+        Brokers with a combined endpoint override this to save round trips.
+
+        Returns:
+            dict with price, current_volume, avg_volume, vwap, rsi,
+            or None if no price is available
+        """
+        price = self.get_stock_price(symbol)
+        if not price:
+            return None
+
+        volume_data = self.get_volume_data(symbol) or {}
+        vwap_data = self.get_vwap(symbol) or {}
+
+        return {
+            "price": price,
+            "current_volume": volume_data.get("current_volume", 0),
+            "avg_volume": volume_data.get("avg_volume", 0),
+            "vwap": vwap_data.get("vwap"),
+            "rsi": self.get_rsi(symbol, period=14),
+        }
+
+    def get_snapshots_bulk(self, symbols: list[str]) -> dict[str, dict]:
+        """
+        Get snapshots for many symbols at once.
+
+        Default implementation calls get_snapshot per symbol. Brokers with
+        multi-symbol endpoints override this to batch the requests.
+
+        Returns:
+            dict of symbol -> snapshot (symbols with no data are omitted)
+        """
+        snapshots = {}
+        for symbol in symbols:
+            snap = self.get_snapshot(symbol)
+            if snap:
+                snapshots[symbol] = snap
+        return snapshots
+
     def get_news(self, symbol: str, limit: int = 5) -> list[dict]:
         """Get recent news."""
         return []
@@ -191,6 +235,11 @@ class PaperBroker(Broker):
         self.order_id_counter = 0
         self.order_history: list[dict] = []
 
+        # Contract ids by (symbol, strike, expiration, option_type), and the
+        # open position for each contract id (first opened wins, as in a scan)
+        self._contract_ids: dict[tuple, int] = {}
+        self._position_index: dict[int, OptionPosition] = {}
+
     def connect(self) -> bool:
         self.connected = True
         logger.info("Connected to Paper Broker", starting_cash=self.cash)
@@ -219,6 +268,49 @@ class PaperBroker(Broker):
     def get_option_positions(self) -> list[OptionPosition]:
         return self.positions
 
+    def intern_contract(self, symbol: str, strike: float, expiration: str, option_type: str) -> int:
+        """
+        Get a stable integer id for a contract.
+
+        Hot loops (price replays) can look the id up once and then use
+        simulate_price_change_by_id() instead of matching on four fields.
+        """
+        key = (symbol, strike, expiration, option_type)
+        contract_id = self._contract_ids.get(key)
+        if contract_id is None:
+            contract_id = self._contract_ids[key] = len(self._contract_ids)
+        return contract_id
+
+    def _find_position(
+        self,
+        symbol: str,
+        strike: float,
+        expiration: str,
+        option_type: str
+    ) -> Optional[OptionPosition]:
+        """Find the open position for a contract."""
+        contract_id = self._contract_ids.get((symbol, strike, expiration, option_type))
+        if contract_id is None:
+            return None
+        return self._position_index.get(contract_id)
+
+    def _unindex_position(self, position: OptionPosition) -> None:
+        """Drop a closed position from the index, promoting any later duplicate."""
+        contract_id = self._contract_ids[
+            (position.symbol, position.strike, position.expiration, position.option_type)
+        ]
+        if self._position_index.get(contract_id) is not position:
+            return
+
+        for pos in self.positions:
+            if (pos.symbol == position.symbol and
+                pos.strike == position.strike and
+                pos.expiration == position.expiration and
+                pos.option_type == position.option_type):
+                self._position_index[contract_id] = pos
+                return
+        del self._position_index[contract_id]
+
     def get_option_quote(
         self,
         symbol: str,
@@ -228,30 +320,27 @@ class PaperBroker(Broker):
     ) -> Optional[OptionQuote]:
         """Return simulated quote based on position or defaults."""
         # Check if we have a position for this option
-        for pos in self.positions:
-            if (pos.symbol == symbol and
-                pos.strike == strike and
-                pos.expiration == expiration and
-                pos.option_type == option_type):
-                # Return quote based on position's current price
-                return OptionQuote(
-                    symbol=symbol,
-                    strike=strike,
-                    expiration=expiration,
-                    option_type=option_type,
-                    bid=pos.current_price * 0.98,
-                    ask=pos.current_price * 1.02,
-                    mark=pos.current_price,
-                    last=pos.current_price,
-                    volume=1000,
-                    open_interest=5000,
-                    implied_volatility=0.30,
-                    delta=0.35 if option_type == "call" else -0.35,
-                    gamma=0.05,
-                    theta=-0.10,
-                    vega=0.15,
-                    underlying_price=100.0,
-                )
+        pos = self._find_position(symbol, strike, expiration, option_type)
+        if pos:
+            # Return quote based on position's current price
+            return OptionQuote(
+                symbol=symbol,
+                strike=strike,
+                expiration=expiration,
+                option_type=option_type,
+                bid=pos.current_price * 0.98,
+                ask=pos.current_price * 1.02,
+                mark=pos.current_price,
+                last=pos.current_price,
+                volume=1000,
+                open_interest=5000,
+                implied_volatility=0.30,
+                delta=0.35 if option_type == "call" else -0.35,
+                gamma=0.05,
+                theta=-0.10,
+                vega=0.15,
+                underlying_price=100.0,
+            )
 
         # Default simulated quote
         return OptionQuote(
@@ -359,6 +448,8 @@ class PaperBroker(Broker):
             created_at=datetime.now(),
         )
         self.positions.append(position)
+        contract_id = self.intern_contract(symbol, strike, expiration, option_type)
+        self._position_index.setdefault(contract_id, position)
 
         # Record order
         self.order_history.append({
@@ -404,14 +495,7 @@ class PaperBroker(Broker):
         self.order_id_counter += 1
 
         # Find matching position
-        matching_pos = None
-        for pos in self.positions:
-            if (pos.symbol == symbol and
-                pos.strike == strike and
-                pos.expiration == expiration and
-                pos.option_type == option_type):
-                matching_pos = pos
-                break
+        matching_pos = self._find_position(symbol, strike, expiration, option_type)
 
         if not matching_pos:
             return OrderResult(
@@ -439,6 +523,7 @@ class PaperBroker(Broker):
         matching_pos.quantity -= quantity
         if matching_pos.quantity <= 0:
             self.positions.remove(matching_pos)
+            self._unindex_position(matching_pos)
 
         # Record order
         order_id = f"PAPER-{self.order_id_counter}"
@@ -520,22 +605,44 @@ class PaperBroker(Broker):
 
         Use this to test trim/stop logic.
         """
-        for pos in self.positions:
-            if (pos.symbol == symbol and
-                pos.strike == strike and
-                pos.expiration == expiration and
-                pos.option_type == option_type):
-                old_price = pos.current_price
-                pos.current_price = new_price
-                pnl_pct = ((new_price - pos.average_cost) / pos.average_cost) * 100
-                logger.info(
-                    "[PAPER] Price updated",
-                    symbol=symbol,
-                    old_price=old_price,
-                    new_price=new_price,
-                    pnl_pct=f"{pnl_pct:.1f}%"
-                )
-                return
+        self.simulate_price_change_by_id(
+            self.intern_contract(symbol, strike, expiration, option_type), new_price
+        )
+
+    def simulate_price_change_by_id(self, contract_id: int, new_price: float) -> None:
+        """
+        Simulate a price change for a contract from intern_contract().
+
+        Fast path for replaying many ticks against the same contract.
+        """
+        pos = self._position_index.get(contract_id)
+        if pos is None:
+            return
+
+        old_price = pos.current_price
+        pos.current_price = new_price
+        pnl_pct = ((new_price - pos.average_cost) / pos.average_cost) * 100
+        logger.info(
+            "[PAPER] Price updated",
+            symbol=pos.symbol,
+            old_price=old_price,
+            new_price=new_price,
+            pnl_pct=f"{pnl_pct:.1f}%"
+        )
+
+    def iter_order_history(self, tail: Optional[int] = 50) -> Iterator[dict]:
+        """
+        Iterate the most recent orders, oldest first.
+
+        Args:
+            tail: Number of recent orders to yield (None for all)
+        """
+        if tail is None:
+            yield from self.order_history
+            return
+
+        recent = list(islice(reversed(self.order_history), tail))
+        yield from reversed(recent)
 
     def get_summary(self) -> dict:
         """Get paper trading summary."""
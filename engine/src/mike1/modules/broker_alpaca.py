@@ -13,6 +13,7 @@ import os
 import structlog
 
 from .broker import Broker, OptionQuote, OptionPosition, OrderResult
+from ..utils.cache import ttl_cache, clear_ttl_cache
 
 logger = structlog.get_logger()
 
@@ -33,6 +34,11 @@ class AlpacaBroker(Broker):
     - ALPACA_PAPER (true/false)
     """
 
+    # Seconds market data is reused for the same symbol. Quotes move fast;
+    # bar-derived indicators only change with new bars.
+    QUOTE_CACHE_TTL = 5
+    BARS_CACHE_TTL = 60
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -113,6 +119,11 @@ class AlpacaBroker(Broker):
         self.connected = False
         logger.info("Disconnected from Alpaca")
 
+    def clear_cache(self) -> None:
+        """Clear cached market data (useful for testing)."""
+        clear_ttl_cache(self)
+        logger.info("Market data cache cleared")
+
     def get_account_info(self) -> dict:
         """Get Alpaca account information."""
         if not self.connected or not self._trading_client:
@@ -522,6 +533,7 @@ class AlpacaBroker(Broker):
             logger.error("Error placing Alpaca sell order", error=str(e))
             return OrderResult(success=False, message=str(e))
 
+    @ttl_cache(QUOTE_CACHE_TTL)
     def get_stock_price(self, symbol: str) -> float:
         """Get current stock price from Alpaca."""
         if not self.connected or not self._data_client:
@@ -650,6 +662,7 @@ class AlpacaBroker(Broker):
     # JUDGE DATA METHODS - Technical indicators for trade scoring
     # =========================================================================
 
+    @ttl_cache(BARS_CACHE_TTL)
     def get_volume_data(self, symbol: str) -> Optional[dict]:
         """
         Get current and average volume for a symbol.
@@ -677,35 +690,13 @@ class AlpacaBroker(Broker):
 
             bars = self._data_client.get_stock_bars(request)
 
-            # Access via .data dict
-            if symbol not in bars.data or len(bars.data[symbol]) < 2:
-                return None
-
-            bar_list = bars.data[symbol]
-
-            # Current volume = today's (or most recent) volume
-            current_volume = int(bar_list[-1].volume)
-
-            # Average volume = 20-day average (excluding today)
-            if len(bar_list) > 20:
-                recent_bars = bar_list[-21:-1]  # Last 20 days before today
-            else:
-                recent_bars = bar_list[:-1]  # All except today
-
-            if not recent_bars:
-                return {"current_volume": current_volume, "avg_volume": current_volume}
-
-            avg_volume = int(sum(b.volume for b in recent_bars) / len(recent_bars))
-
-            return {
-                "current_volume": current_volume,
-                "avg_volume": avg_volume
-            }
+            return self._volume_from_bars(bars.data.get(symbol, []))
 
         except Exception as e:
             logger.error("Error getting volume data", symbol=symbol, error=str(e))
             return None
 
+    @ttl_cache(BARS_CACHE_TTL)
     def get_vwap(self, symbol: str) -> Optional[dict]:
         """
         Get VWAP (Volume Weighted Average Price) for today.
@@ -763,6 +754,7 @@ class AlpacaBroker(Broker):
             logger.error("Error getting VWAP", symbol=symbol, error=str(e))
             return None
 
+    @ttl_cache(BARS_CACHE_TTL)
     def get_rsi(self, symbol: str, period: int = 14) -> float:
         """
         Calculate RSI (Relative Strength Index) for a symbol.
@@ -798,47 +790,190 @@ class AlpacaBroker(Broker):
 
             bars = self._data_client.get_stock_bars(request)
 
-            if symbol not in bars or len(bars[symbol]) < period + 1:
-                return 50
+            rsi = self._rsi_from_bars(bars.data.get(symbol, []), period)
 
-            bar_list = list(bars[symbol])
+            logger.debug("RSI calculated", symbol=symbol, rsi=f"{rsi:.1f}", period=period)
+            return rsi
 
-            # Calculate price changes
-            gains = []
-            losses = []
+        except Exception as e:
+            logger.error("Error calculating RSI", symbol=symbol, error=str(e))
+            return 50
 
-            for i in range(1, len(bar_list)):
-                change = float(bar_list[i].close) - float(bar_list[i-1].close)
-                if change >= 0:
-                    gains.append(change)
-                    losses.append(0)
-                else:
-                    gains.append(0)
-                    losses.append(abs(change))
+    def get_snapshot(self, symbol: str) -> Optional[dict]:
+        """
+        Get price, volume, VWAP and RSI for a symbol.
 
-            # Take last N periods
-            if len(gains) < period:
-                return 50
+        Two requests instead of four: the stock snapshot (quote + today's
+        daily bar, which carries VWAP) and one 30-day daily bar series
+        that feeds both the volume average and RSI.
 
-            recent_gains = gains[-period:]
-            recent_losses = losses[-period:]
+        Returns:
+            dict with price, current_volume, avg_volume, vwap, rsi,
+            or None on error
+        """
+        if not self.connected or not self._data_client:
+            return None
 
-            avg_gain = sum(recent_gains) / period
-            avg_loss = sum(recent_losses) / period
+        try:
+            from alpaca.data.requests import StockSnapshotRequest, StockBarsRequest
+            from alpaca.data.timeframe import TimeFrame
+            from datetime import timedelta
 
-            if avg_loss == 0:
-                return 100  # All gains
+            snapshots = self._data_client.get_stock_snapshot(
+                StockSnapshotRequest(symbol_or_symbols=symbol)
+            )
 
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
+            end = datetime.now()
+            bars = self._data_client.get_stock_bars(StockBarsRequest(
+                symbol_or_symbols=symbol,
+                timeframe=TimeFrame.Day,
+                start=end - timedelta(days=30),
+                end=end
+            ))
 
-            logger.debug("RSI calculated", symbol=symbol, rsi=f"{rsi:.1f}", period=period)
-            return rsi
+            return self._build_snapshot(snapshots.get(symbol), bars.data.get(symbol, []))
 
         except Exception as e:
-            logger.error("Error calculating RSI", symbol=symbol, error=str(e))
+            logger.error("Error getting snapshot", symbol=symbol, error=str(e))
+            return None
+
+    # Symbols per multi-symbol snapshot/bars request
+    SNAPSHOT_CHUNK_SIZE = 50
+
+    def get_snapshots_bulk(self, symbols: list[str]) -> dict[str, dict]:
+        """
+        Get snapshots for many symbols.
+
+        Symbols are sent in chunks of SNAPSHOT_CHUNK_SIZE, two requests per
+        chunk (snapshots + daily bars), instead of two per symbol.
+
+        Returns:
+            dict of symbol -> snapshot (symbols with no data are omitted)
+        """
+        if not self.connected or not self._data_client:
+            return {}
+
+        from alpaca.data.requests import StockSnapshotRequest, StockBarsRequest
+        from alpaca.data.timeframe import TimeFrame
+        from datetime import timedelta
+
+        results = {}
+        end = datetime.now()
+        start = end - timedelta(days=30)
+
+        for i in range(0, len(symbols), self.SNAPSHOT_CHUNK_SIZE):
+            chunk = symbols[i:i + self.SNAPSHOT_CHUNK_SIZE]
+
+            try:
+                snapshots = self._data_client.get_stock_snapshot(
+                    StockSnapshotRequest(symbol_or_symbols=chunk)
+                )
+                bars = self._data_client.get_stock_bars(StockBarsRequest(
+                    symbol_or_symbols=chunk,
+                    timeframe=TimeFrame.Day,
+                    start=start,
+                    end=end
+                ))
+
+                for symbol in chunk:
+                    snap = self._build_snapshot(snapshots.get(symbol), bars.data.get(symbol, []))
+                    if snap:
+                        results[symbol] = snap
+
+            except Exception as e:
+                logger.error("Error getting bulk snapshots", symbols=len(chunk), error=str(e))
+
+        return results
+
+    def _build_snapshot(self, snap, bar_list: list, period: int = 14) -> Optional[dict]:
+        """Combine an Alpaca stock snapshot and daily bars into a snapshot dict."""
+        if snap is None:
+            return None
+
+        price = 0.0
+        quote = snap.latest_quote
+        if quote and quote.bid_price and quote.ask_price:
+            price = (float(quote.bid_price) + float(quote.ask_price)) / 2
+        elif snap.latest_trade and snap.latest_trade.price:
+            price = float(snap.latest_trade.price)
+
+        if not price:
+            return None
+
+        volume_data = self._volume_from_bars(bar_list) or {}
+        daily_bar = snap.daily_bar
+
+        return {
+            "price": price,
+            "current_volume": volume_data.get("current_volume", 0),
+            "avg_volume": volume_data.get("avg_volume", 0),
+            "vwap": float(daily_bar.vwap) if daily_bar and daily_bar.vwap else None,
+            "rsi": self._rsi_from_bars(bar_list, period),
+        }
+
+    @staticmethod
+    def _volume_from_bars(bar_list: list) -> Optional[dict]:
+        """Current volume and 20-day average (excluding today) from daily bars."""
+        if len(bar_list) < 2:
+            return None
+
+        # Current volume = today's (or most recent) volume
+        current_volume = int(bar_list[-1].volume)
+
+        # Average volume = 20-day average (excluding today)
+        if len(bar_list) > 20:
+            recent_bars = bar_list[-21:-1]  # Last 20 days before today
+        else:
+            recent_bars = bar_list[:-1]  # All except today
+
+        if not recent_bars:
+            return {"current_volume": current_volume, "avg_volume": current_volume}
+
+        avg_volume = int(sum(b.volume for b in recent_bars) / len(recent_bars))
+
+        return {
+            "current_volume": current_volume,
+            "avg_volume": avg_volume
+        }
+
+    @staticmethod
+    def _rsi_from_bars(bar_list: list, period: int = 14) -> float:
+        """
+        RSI from daily bars.
+
+        RSI = 100 - (100 / (1 + RS))
+        RS = Average Gain / Average Loss over the last N closes
+
+        Returns 50 (neutral) when there aren't enough bars.
+        """
+        if len(bar_list) < period + 1:
             return 50
 
+        # Calculate price changes
+        gains = []
+        losses = []
+
+        for i in range(1, len(bar_list)):
+            change = float(bar_list[i].close) - float(bar_list[i-1].close)
+            if change >= 0:
+                gains.append(change)
+                losses.append(0)
+            else:
+                gains.append(0)
+                losses.append(abs(change))
+
+        recent_gains = gains[-period:]
+        recent_losses = losses[-period:]
+
+        avg_gain = sum(recent_gains) / period
+        avg_loss = sum(recent_losses) / period
+
+        if avg_loss == 0:
+            return 100  # All gains
+
+        rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
     def get_news(self, symbol: str, limit: int = 5) -> list[dict]:
         """
         Get recent news headlines for a symbol.
@@ -159,6 +159,16 @@ class FailoverBroker(Broker):
             return 0
         return self.active.get_stock_price(symbol)
 
+    def get_snapshot(self, symbol):
+        if not self._ensure_connected():
+            return None
+        return self.active.get_snapshot(symbol)
+
+    def get_snapshots_bulk(self, symbols):
+        if not self._ensure_connected():
+            return {}
+        return self.active.get_snapshots_bulk(symbols)
+
     @property
     def connected(self) -> bool:
         return self.active is not None and self.active.connected
@@ -18,7 +18,7 @@ from datetime import datetime
 
 from ..core.trade import OptionCandidate, CuratorResult, TradeSignal
 from ..core.config import Config
-from ..utils.dates import get_next_fridays, calculate_dte, filter_expirations_by_dte
+from ..utils.dates import cached_now, get_next_fridays, calculate_dte, filter_expirations_by_dte
 from .broker import Broker, OptionQuote
 from structlog import get_logger
 
@@ -169,14 +169,17 @@ class Curator:
         Returns:
             List of YYYY-MM-DD strings for valid expirations
         """
+        now = cached_now()
+
         # Calculate next 4 Fridays (covers up to ~28 DTE)
-        all_fridays = get_next_fridays(count=4)
+        all_fridays = get_next_fridays(count=4, from_date=now)
 
         # Filter to min_dte:max_dte range
         valid = filter_expirations_by_dte(
             all_fridays,
             self.config.options.min_dte,
-            self.config.options.max_dte
+            self.config.options.max_dte,
+            from_date=now
         )
 
         return valid
@@ -29,6 +29,34 @@ class ExecutorState:
     pending_orders: list[str] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class ExitAction:
+    """An exit the executor took (or would take in dry run)."""
+    type: str
+    position_id: str
+    ticker: str
+    contracts: int
+    price: float
+    executed: bool = False
+    order_id: Optional[str] = None
+
+    # Exit-specific details (None when not applicable)
+    pnl_pct: Optional[float] = None
+    reason: Optional[str] = None
+    dte: Optional[int] = None
+    high_water: Optional[float] = None
+    stop_level: Optional[float] = None
+    atr: Optional[float] = None
+    drawdown_pct: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        """Convert to dict for logging, omitting unset details."""
+        return {
+            name: value for name in self.__slots__
+            if (value := getattr(self, name)) is not None
+        }
+
+
 class Executor:
     """
     The Executor.
@@ -71,13 +99,17 @@ class Executor:
     # POSITION SYNC
     # =========================================================================
 
-    def sync_positions(self) -> None:
+    def sync_positions(self, broker_positions: Optional[list[OptionPosition]] = None) -> None:
         """
         Sync positions from broker.
 
         This pulls current positions and updates our tracking.
+
+        Args:
+            broker_positions: Already-fetched broker positions (fetched if None)
         """
-        broker_positions = self.broker.get_option_positions()
+        if broker_positions is None:
+            broker_positions = self.broker.get_option_positions()
 
         for bp in broker_positions:
             pos_id = bp.id
@@ -151,7 +183,7 @@ class Executor:
     # EXIT LOGIC
     # =========================================================================
 
-    def check_exits(self) -> list[dict]:
+    def check_exits(self) -> list[ExitAction]:
         """
         Check all positions for exit conditions.
 
@@ -172,7 +204,20 @@ class Executor:
 
         return actions
 
-    def _evaluate_position(self, pos: Position) -> Optional[dict]:
+    def tick(self) -> list[ExitAction]:
+        """
+        Sync from the broker and check exits in one step.
+
+        Fetches broker positions once per tick and hands that list to
+        sync_positions(); check_exits() then reads only tracked state.
+
+        Returns list of actions taken.
+        """
+        broker_positions = self.broker.get_option_positions()
+        self.sync_positions(broker_positions)
+        return self.check_exits()
+
+    def _evaluate_position(self, pos: Position) -> Optional[ExitAction]:
         """
         Evaluate a single position for exit conditions.
 
@@ -216,7 +261,7 @@ class Executor:
 
         return None
 
-    def _execute_hard_stop(self, pos: Position) -> dict:
+    def _execute_hard_stop(self, pos: Position) -> ExitAction:
         """Execute hard stop loss."""
         logger.warning(
             "HARD STOP TRIGGERED",
@@ -226,31 +271,30 @@ class Executor:
             entry_price=pos.entry_price
         )
 
-        action = {
-            "type": "hard_stop",
-            "position_id": str(pos.id),
-            "ticker": pos.ticker,
-            "contracts": pos.contracts_remaining,
-            "price": pos.current_price,
-            "pnl_pct": pos.pnl_percent,
-            "executed": False
-        }
+        action = ExitAction(
+            type="hard_stop",
+            position_id=str(pos.id),
+            ticker=pos.ticker,
+            contracts=pos.contracts_remaining,
+            price=pos.current_price,
+            pnl_pct=pos.pnl_percent
+        )
 
         if not self.dry_run:
             result = self._sell_position(pos, pos.contracts_remaining, "hard_stop")
-            action["executed"] = result.success
-            action["order_id"] = result.order_id
+            action.executed = result.success
+            action.order_id = result.order_id
 
             if result.success:
                 pos.close(pos.current_price, "stop")
                 self.governor.record_pnl(pos.realized_pnl)
                 self.governor.record_close()
         else:
-            logger.info("[DRY RUN] Would execute hard stop", **action)
+            logger.info("[DRY RUN] Would execute hard stop", **action.to_dict())
 
         return action
 
-    def _execute_0dte_close(self, pos: Position) -> dict:
+    def _execute_0dte_close(self, pos: Position) -> ExitAction:
         """Force close 0DTE position before Alpaca cutoff."""
         logger.warning(
             "0DTE FORCE CLOSE (time-based)",
@@ -260,32 +304,31 @@ class Executor:
             force_close_time=self.config.exits.force_close_0dte_time
         )
 
-        action = {
-            "type": "0dte_close",
-            "position_id": str(pos.id),
-            "ticker": pos.ticker,
-            "contracts": pos.contracts_remaining,
-            "price": pos.current_price,
-            "pnl_pct": pos.pnl_percent,
-            "reason": "0DTE time-based force close",
-            "executed": False
-        }
+        action = ExitAction(
+            type="0dte_close",
+            position_id=str(pos.id),
+            ticker=pos.ticker,
+            contracts=pos.contracts_remaining,
+            price=pos.current_price,
+            pnl_pct=pos.pnl_percent,
+            reason="0DTE time-based force close"
+        )
 
         if not self.dry_run:
             result = self._sell_position(pos, pos.contracts_remaining, "0dte_close")
-            action["executed"] = result.success
-            action["order_id"] = result.order_id
+            action.executed = result.success
+            action.order_id = result.order_id
 
             if result.success:
                 pos.close(pos.current_price, "expired")
                 self.governor.record_pnl(pos.realized_pnl)
                 self.governor.record_close()
         else:
-            logger.info("[DRY RUN] Would execute 0DTE close", **action)
+            logger.info("[DRY RUN] Would execute 0DTE close", **action.to_dict())
 
         return action
 
-    def _execute_dte_close(self, pos: Position) -> dict:
+    def _execute_dte_close(self, pos: Position) -> ExitAction:
         """Force close due to expiration."""
         logger.warning(
             "DTE FORCE CLOSE",
@@ -294,31 +337,30 @@ class Executor:
             pnl_pct=f"{pos.pnl_percent:.1f}%"
         )
 
-        action = {
-            "type": "dte_close",
-            "position_id": str(pos.id),
-            "ticker": pos.ticker,
-            "contracts": pos.contracts_remaining,
-            "price": pos.current_price,
-            "dte": pos.days_to_expiration,
-            "executed": False
-        }
+        action = ExitAction(
+            type="dte_close",
+            position_id=str(pos.id),
+            ticker=pos.ticker,
+            contracts=pos.contracts_remaining,
+            price=pos.current_price,
+            dte=pos.days_to_expiration
+        )
 
         if not self.dry_run:
             result = self._sell_position(pos, pos.contracts_remaining, "dte_close")
-            action["executed"] = result.success
-            action["order_id"] = result.order_id
+            action.executed = result.success
+            action.order_id = result.order_id
 
             if result.success:
                 pos.close(pos.current_price, "expired")
                 self.governor.record_pnl(pos.realized_pnl)
                 self.governor.record_close()
         else:
-            logger.info("[DRY RUN] Would execute DTE close", **action)
+            logger.info("[DRY RUN] Would execute DTE close", **action.to_dict())
 
         return action
 
-    def _execute_atr_trailing_stop(self, pos: Position) -> dict:
+    def _execute_atr_trailing_stop(self, pos: Position) -> ExitAction:
         """Execute ATR-based trailing stop (trails from entry)."""
         logger.info(
             "ATR TRAILING STOP TRIGGERED",
@@ -330,34 +372,33 @@ class Executor:
             pnl=f"{pos.pnl_percent:.1f}%"
         )
 
-        action = {
-            "type": "atr_trailing_stop",
-            "position_id": str(pos.id),
-            "ticker": pos.ticker,
-            "contracts": pos.contracts_remaining,
-            "price": pos.current_price,
-            "high_water": pos.high_water_mark,
-            "stop_level": pos.atr_stop_level,
-            "atr": pos.atr_value,
-            "pnl_pct": pos.pnl_percent,
-            "executed": False
-        }
+        action = ExitAction(
+            type="atr_trailing_stop",
+            position_id=str(pos.id),
+            ticker=pos.ticker,
+            contracts=pos.contracts_remaining,
+            price=pos.current_price,
+            high_water=pos.high_water_mark,
+            stop_level=pos.atr_stop_level,
+            atr=pos.atr_value,
+            pnl_pct=pos.pnl_percent
+        )
 
         if not self.dry_run:
             result = self._sell_position(pos, pos.contracts_remaining, "atr_trailing_stop")
-            action["executed"] = result.success
-            action["order_id"] = result.order_id
+            action.executed = result.success
+            action.order_id = result.order_id
 
             if result.success:
                 pos.close(pos.current_price, "trailing_stop")
                 self.governor.record_pnl(pos.realized_pnl)
                 self.governor.record_close()
         else:
-            logger.info("[DRY RUN] Would execute ATR trailing stop", **action)
+            logger.info("[DRY RUN] Would execute ATR trailing stop", **action.to_dict())
 
         return action
 
-    def _execute_trailing_stop(self, pos: Position) -> dict:
+    def _execute_trailing_stop(self, pos: Position) -> ExitAction:
         """Execute percentage-based trailing stop."""
         logger.info(
             "TRAILING STOP TRIGGERED",
@@ -368,32 +409,31 @@ class Executor:
             locked_pnl=f"{pos.high_water_pnl_percent:.1f}%"
         )
 
-        action = {
-            "type": "trailing_stop",
-            "position_id": str(pos.id),
-            "ticker": pos.ticker,
-            "contracts": pos.contracts_remaining,
-            "price": pos.current_price,
-            "high_water": pos.high_water_mark,
-            "drawdown_pct": pos.drawdown_from_high,
-            "executed": False
-        }
+        action = ExitAction(
+            type="trailing_stop",
+            position_id=str(pos.id),
+            ticker=pos.ticker,
+            contracts=pos.contracts_remaining,
+            price=pos.current_price,
+            high_water=pos.high_water_mark,
+            drawdown_pct=pos.drawdown_from_high
+        )
 
         if not self.dry_run:
             result = self._sell_position(pos, pos.contracts_remaining, "trailing_stop")
-            action["executed"] = result.success
-            action["order_id"] = result.order_id
+            action.executed = result.success
+            action.order_id = result.order_id
 
             if result.success:
                 pos.close(pos.current_price, "trailing_stop")
                 self.governor.record_pnl(pos.realized_pnl)
                 self.governor.record_close()
         else:
-            logger.info("[DRY RUN] Would execute trailing stop", **action)
+            logger.info("[DRY RUN] Would execute trailing stop", **action.to_dict())
 
         return action
 
-    def _execute_trim(self, pos: Position, trim_number: int) -> Optional[dict]:
+    def _execute_trim(self, pos: Position, trim_number: int) -> Optional[ExitAction]:
         """Execute a trim."""
         # For single contract positions, skip actual trim but activate trailing stop
         if pos.contracts_remaining == 1 and trim_number == 1:
@@ -437,20 +477,19 @@ class Executor:
             remaining=pos.contracts_remaining - contracts_to_sell
         )
 
-        action = {
-            "type": f"trim_{trim_number}",
-            "position_id": str(pos.id),
-            "ticker": pos.ticker,
-            "contracts": contracts_to_sell,
-            "price": pos.current_price,
-            "pnl_pct": pos.pnl_percent,
-            "executed": False
-        }
+        action = ExitAction(
+            type=f"trim_{trim_number}",
+            position_id=str(pos.id),
+            ticker=pos.ticker,
+            contracts=contracts_to_sell,
+            price=pos.current_price,
+            pnl_pct=pos.pnl_percent
+        )
 
         if not self.dry_run:
             result = self._sell_position(pos, contracts_to_sell, f"trim_{trim_number}")
-            action["executed"] = result.success
-            action["order_id"] = result.order_id
+            action.executed = result.success
+            action.order_id = result.order_id
 
             if result.success:
                 pos.record_trim(trim_number, pos.current_price, contracts_to_sell)
@@ -458,7 +497,7 @@ class Executor:
                     (pos.current_price - pos.entry_price) * contracts_to_sell * 100
                 )
         else:
-            logger.info(f"[DRY RUN] Would execute trim {trim_number}", **action)
+            logger.info(f"[DRY RUN] Would execute trim {trim_number}", **action.to_dict())
 
         return action
 
@@ -592,7 +631,7 @@ class Executor:
     # MAIN LOOP
     # =========================================================================
 
-    def poll(self) -> list[dict]:
+    def poll(self) -> list[ExitAction]:
         """
         Single poll cycle.
 
@@ -602,11 +641,8 @@ class Executor:
         actions = []
 
         try:
-            # Sync positions from broker
-            self.sync_positions()
-
-            # Check for exit conditions
-            exit_actions = self.check_exits()
+            # Sync positions from broker and check for exit conditions
+            exit_actions = self.tick()
             actions.extend(exit_actions)
 
             # Log status
@@ -15,7 +15,8 @@ Output: Grade (A/B/NO_TRADE) + Score (0-10) + Reasoning
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
+import heapq
 import structlog
 
 from ..core.config import get_config
@@ -146,6 +147,12 @@ class JudgeVerdict:
         }
 
 
+def _aggregate(tech: float, liq: float, cat: float,
+               w_tech: float, w_liq: float, w_cat: float) -> float:
+    """Weighted sum of the three factor scores."""
+    return tech * w_tech + liq * w_liq + cat * w_cat
+
+
 class Judge:
     """
     The Judge - grades trade candidates objectively.
@@ -178,6 +185,11 @@ class Judge:
         self.broker = broker
         self.llm_client = llm_client
         self.config = get_config()
+        self._weights = (
+            self.WEIGHTS["technical"],
+            self.WEIGHTS["liquidity"],
+            self.WEIGHTS["catalyst"],
+        )
 
     def grade(
         self,
@@ -185,7 +197,8 @@ class Judge:
         direction: str,
         strike: Optional[float] = None,
         expiration: Optional[str] = None,
-        use_llm: bool = True
+        use_llm: bool = True,
+        technical: Optional[TechnicalData] = None
     ) -> JudgeVerdict:
         """
         Grade a trade candidate.
@@ -195,6 +208,9 @@ class Judge:
             direction: "call" or "put"
             strike: Optional strike price (for liquidity check)
             expiration: Optional expiration date (for liquidity check)
+            technical: Optional pre-fetched technical data for this symbol
+                (e.g. a previous verdict's .technical when grading several
+                contracts on the same underlying)
 
         Returns:
             JudgeVerdict with grade, score, and reasoning
@@ -205,7 +221,8 @@ class Judge:
         warnings = []
 
         # 1. Get technical data
-        technical = self._get_technical_data(symbol)
+        if technical is None:
+            technical = self._get_technical_data(symbol)
         tech_score, tech_reasons = self._score_technical(technical, direction)
         reasoning.extend(tech_reasons)
 
@@ -233,19 +250,10 @@ class Judge:
             warnings.append("No LLM client - catalyst not scored (defaulting to neutral 5.0)")
 
         # 4. Calculate weighted score
-        score = (
-            tech_score * self.WEIGHTS["technical"] +
-            liq_score * self.WEIGHTS["liquidity"] +
-            cat_score * self.WEIGHTS["catalyst"]
-        )
+        score = _aggregate(tech_score, liq_score, cat_score, *self._weights)
 
         # 5. Determine grade
-        if score >= self.A_TIER_MIN:
-            grade = TradeGrade.A_TIER
-        elif score >= self.B_TIER_MIN:
-            grade = TradeGrade.B_TIER
-        else:
-            grade = TradeGrade.NO_TRADE
+        grade = self._grade_for(score)
 
         verdict = JudgeVerdict(
             symbol=symbol,
@@ -275,6 +283,91 @@ class Judge:
 
         return verdict
 
+    def _grade_for(self, score: float) -> TradeGrade:
+        """Map a weighted score to its grade."""
+        if score >= self.A_TIER_MIN:
+            return TradeGrade.A_TIER
+        elif score >= self.B_TIER_MIN:
+            return TradeGrade.B_TIER
+        return TradeGrade.NO_TRADE
+
+    def grade_many(
+        self,
+        symbol: str,
+        direction: str,
+        contracts: Sequence[tuple[float, str]],
+        use_llm: bool = True
+    ) -> list[JudgeVerdict]:
+        """
+        Grade several contracts on the same underlying in one pass.
+
+        Technical and catalyst data depend only on symbol/direction, so they
+        are fetched and scored once (one LLM call, not one per contract).
+        Each contract then gets the same weighted score and grade as grade().
+
+        Args:
+            symbol: Ticker symbol (e.g., "NVDA")
+            direction: "call" or "put"
+            contracts: (strike, expiration) pairs to grade
+            use_llm: Score catalyst with the LLM if available
+
+        Returns:
+            JudgeVerdicts in the same order as contracts
+        """
+        if not contracts:
+            return []
+
+        logger.info("Judge evaluating batch", symbol=symbol, direction=direction,
+                    contracts=len(contracts))
+
+        technical = self._get_technical_data(symbol)
+        tech_score, tech_reasons = self._score_technical(technical, direction)
+
+        catalyst = None
+        cat_score = 5.0  # Default neutral if no LLM
+        cat_reasons = []
+        warnings = []
+        if self.llm_client and use_llm:
+            catalyst = self._get_catalyst_data(symbol, direction)
+            cat_score, cat_reasons = self._score_catalyst(catalyst)
+        else:
+            warnings.append("No LLM client - catalyst not scored (defaulting to neutral 5.0)")
+
+        liquidities = []
+        liq_results = []
+        for strike, expiration in contracts:
+            liquidity = self._get_liquidity_data(symbol, strike, expiration, direction)
+            liquidities.append(liquidity)
+            liq_results.append(self._score_liquidity(liquidity))
+
+        verdicts = []
+        for liquidity, (liq_score, liq_reasons) in zip(liquidities, liq_results):
+            score = _aggregate(tech_score, liq_score, cat_score, *self._weights)
+            verdicts.append(JudgeVerdict(
+                symbol=symbol,
+                direction=direction,
+                grade=self._grade_for(score),
+                score=score,
+                technical_score=tech_score,
+                liquidity_score=liq_score,
+                catalyst_score=cat_score,
+                weights=self.WEIGHTS,
+                reasoning=[*tech_reasons, *liq_reasons, *cat_reasons],
+                warnings=list(warnings),
+                technical=technical,
+                liquidity=liquidity,
+                catalyst=catalyst
+            ))
+
+        logger.info(
+            "Judge batch verdicts",
+            symbol=symbol,
+            grades=[v.grade.value for v in verdicts],
+            best=f"{max(v.score for v in verdicts):.1f}/10"
+        )
+
+        return verdicts
+
     def _get_technical_data(self, symbol: str) -> TechnicalData:
         """Fetch technical indicators from broker."""
         data = TechnicalData(symbol=symbol)
@@ -391,11 +484,11 @@ class Judge:
                 data.social_bullish_pct = social_data.stocktwits_bullish_pct
 
                 # Get sample messages for LLM context (top 5 most liked)
-                sorted_msgs = sorted(
+                sorted_msgs = heapq.nlargest(
+                    5,
                     social_data.stocktwits_messages,
-                    key=lambda x: x.get("likes", 0),
-                    reverse=True
-                )[:5]
+                    key=lambda x: x.get("likes", 0)
+                )
                 data.social_messages = [m.get("body", "") for m in sorted_msgs]
 
                 # Reddit
@@ -404,11 +497,11 @@ class Judge:
                 data.reddit_bullish_pct = social_data.reddit_bullish_pct
 
                 # Get sample Reddit post titles (top by score)
-                sorted_posts = sorted(
+                sorted_posts = heapq.nlargest(
+                    5,
                     social_data.reddit_posts,
-                    key=lambda x: x.get("score", 0),
-                    reverse=True
-                )[:5]
+                    key=lambda x: x.get("score", 0)
+                )
                 data.reddit_posts = [p.get("title", "") for p in sorted_posts]
 
             except ImportError:
@@ -621,3 +714,7 @@ Respond with:
                 lines.append(f"  ! {warning}")
 
         return "\n".join(lines)
+
+
+# Checked once at import rather than on every grade
+assert abs(sum(Judge.WEIGHTS.values()) - 1.0) < 1e-9, "Judge weights must sum to 1.0"
@@ -10,12 +10,35 @@ Usage:
 """
 
 import os
+import re
 import json
 from typing import Optional
 import structlog
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = structlog.get_logger()
 
+# ```info\n...``` wrapper around the whole response. The info string runs to
+# the end of the line (tag, trailing spaces, CR), so the body may end in "\r"
+# but JSON treats that as whitespace.
+_FENCE_RE = re.compile(r"\A```[^\n]*\n(.*?)\n?```\s*\Z", re.S)
+
+# Whitespace JSON allows before a value
+_JSON_WHITESPACE = " \t\r\n"
+
+
+def _is_bare_json_object(text: str) -> bool:
+    """True if the first non-whitespace character is '{' (nothing to unwrap)."""
+    for ch in text:
+        if ch not in _JSON_WHITESPACE:
+            return ch == "{"
+    return False
+
 
 class LLMClient:
     """Base class for LLM clients."""
@@ -93,15 +116,18 @@ IMPORTANT: Respond ONLY with valid JSON in this exact format:
             if not response or not response.text:
                 return None
 
-            # Parse JSON from response
-            text = response.text.strip()
+            # Parse JSON from response. Bare JSON (the usual case) goes straight
+            # to the parser, which skips surrounding whitespace itself.
+            text = response.text
+            if not _is_bare_json_object(text):
+                text = text.strip()
 
-            # Handle markdown code blocks
-            if text.startswith("```"):
-                lines = text.split("\n")
-                text = "\n".join(lines[1:-1])  # Remove first and last lines
+                # Handle markdown code blocks
+                fenced = _FENCE_RE.match(text)
+                if fenced:
+                    text = fenced.group(1)
 
-            result = json.loads(text)
+            result = orjson.loads(text) if HAS_ORJSON else json.loads(text)
 
             logger.debug(
                 "Gemini catalyst assessment",
@@ -112,7 +138,7 @@ IMPORTANT: Respond ONLY with valid JSON in this exact format:
 
             return result
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
             logger.error("Error parsing Gemini response as JSON", error=str(e))
             return None
         except Exception as e:
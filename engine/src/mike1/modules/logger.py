@@ -10,15 +10,145 @@ from datetime import datetime
 from typing import Optional, Any
 import json
 import os
+import queue
+import threading
+import weakref
 from pathlib import Path
 import structlog
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from ..core.position import Position
 from ..core.trade import Trade, TradeSignal
+from ..utils.database import Database
+from ..utils.dates import format_date
 
 
 logger = structlog.get_logger()
 
+# Queue sentinels for the writer thread
+_STOP = object()      # exit
+_ROTATE = object()    # date rolled - close the previous day's fds
+
+# Raw append-only descriptors; O_APPEND keeps each gather-write atomic
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+
+def _serialize(data: dict) -> bytes:
+    """Serialize a record to a newline-terminated JSON line."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(data) + "\n").encode()
+
+
+def _write_lines(fd: int, lines: list[bytes]) -> None:
+    """Append serialized lines to a raw fd in one syscall."""
+    if hasattr(os, "writev"):
+        written = os.writev(fd, lines)
+    else:
+        written = os.write(fd, b"".join(lines))
+
+    # Short write (e.g. disk nearly full) - push out the remainder
+    remainder = b"".join(lines)[written:] if written < sum(map(len, lines)) else b""
+    while remainder:
+        remainder = remainder[os.write(fd, remainder):]
+
+
+def _write_pending(fds: dict[Path, int], pending: dict[Path, list[bytes]]) -> None:
+    """Write grouped lines, one gather-write per file."""
+    for file_path, lines in pending.items():
+        try:
+            fd = fds.get(file_path)
+            if fd is None:
+                fd = os.open(file_path, _OPEN_FLAGS, 0o644)
+                fds[file_path] = fd
+            _write_lines(fd, lines)
+        except OSError as e:
+            logger.error("Error writing log file", file=str(file_path), lines=len(lines), error=str(e))
+
+
+def _close_fds(fds: dict[Path, int]) -> None:
+    """Close every cached log fd."""
+    for fd in fds.values():
+        try:
+            os.close(fd)
+        except OSError as e:
+            logger.error("Error closing log file", error=str(e))
+    fds.clear()
+
+
+def _writer_loop(q: queue.SimpleQueue, fds: dict[Path, int], batch_size: int) -> None:
+    """Drain the queue in batches until the stop sentinel arrives."""
+    running = True
+    while running:
+        batch = [q.get()]
+        while len(batch) < batch_size:
+            try:
+                batch.append(q.get_nowait())
+            except queue.Empty:
+                break
+
+        pending: dict[Path, list[bytes]] = {}
+        try:
+            for item in batch:
+                if item is _STOP:
+                    running = False
+                elif item is _ROTATE:
+                    _write_pending(fds, pending)
+                    pending = {}
+                    _close_fds(fds)
+                elif isinstance(item, threading.Event):
+                    # flush() barrier - everything queued before it goes out first
+                    _write_pending(fds, pending)
+                    pending = {}
+                    item.set()
+                else:
+                    file_path, line = item
+                    pending.setdefault(file_path, []).append(line)
+
+            _write_pending(fds, pending)
+        except Exception as e:
+            # Keep the writer alive: drop this batch, but still release any
+            # flush() waiters and honour a stop that was queued in it
+            logger.error("Log writer batch failed", records=len(batch), error=str(e))
+            for item in batch:
+                if item is _STOP:
+                    running = False
+                elif isinstance(item, threading.Event):
+                    item.set()
+
+
+def _stop_writer(
+    lock: threading.Lock,
+    stopped: threading.Event,
+    q: queue.SimpleQueue,
+    writer: threading.Thread,
+    fds: dict[Path, int],
+    timeout: float
+) -> None:
+    """
+    Stop a TradeLogger's writer thread after it drains the queue.
+
+    Holds no reference to the logger, so the weakref.finalize that runs
+    it at exit doesn't keep the logger alive.
+    """
+    with lock:
+        if stopped.is_set():
+            return
+        stopped.set()
+        q.put(_STOP)
+
+    writer.join(timeout)
+    if writer.is_alive():
+        # Still writing - leave its fds open rather than pull them out from under it
+        logger.warning("Log writer did not stop in time", timeout=timeout)
+        return
+    _close_fds(fds)
+
 
 @dataclass
 class TradeLog:
@@ -102,13 +232,32 @@ class TradeLogger:
     - P&L
 
     Data is append-only. No editing. No deletion.
+
+    Records are serialized on the caller's thread and handed to a
+    background writer, so Scout/Executor never block on disk I/O.
+    Call close() (or flush()) before reading the files from elsewhere.
     """
 
+    # Max queued lines written per writer wake-up
+    WRITE_BATCH_SIZE = 256
+
+    # Seconds flush()/close() wait on the writer before giving up
+    FLUSH_TIMEOUT = 10.0
+    CLOSE_TIMEOUT = 10.0
+
     def __init__(self, log_dir: str = "logs", db_url: Optional[str] = None):
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
         self.db_url = db_url or os.environ.get("DATABASE_URL")
+        self._db: Optional[Database] = None  # Opened on first database read
+
+        # Background writer (owns the raw fds, held open until the date rolls)
+        self._fds: dict[Path, int] = {}
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Guards stopped-check + put so nothing is queued behind _STOP
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
 
         # Current day's log file
         self._current_date = None
@@ -116,20 +265,74 @@ class TradeLogger:
         self._actions_file = None
 
         self._ensure_files()
+        self._writer = threading.Thread(
+            target=_writer_loop,
+            args=(self._queue, self._fds, self.WRITE_BATCH_SIZE),
+            name="trade-logger-writer",
+            daemon=True
+        )
+        self._writer.start()
+        # Drains the writer at interpreter exit (or when collected) unless close() ran
+        self._finalizer = weakref.finalize(
+            self, _stop_writer, self._lock, self._stopped, self._queue, self._writer, self._fds,
+            self.CLOSE_TIMEOUT
+        )
 
     def _ensure_files(self) -> None:
         """Ensure log files exist for today."""
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = format_date(datetime.now())
 
         if self._current_date != today:
+            if self._current_date is not None:
+                with self._lock:
+                    if not self._stopped.is_set():
+                        self._queue.put(_ROTATE)
+
             self._current_date = today
             self._trades_file = self.log_dir / f"trades_{today}.jsonl"
             self._actions_file = self.log_dir / f"actions_{today}.jsonl"
 
     def _append_jsonl(self, file_path: Path, data: dict) -> None:
-        """Append a JSON line to file."""
-        with open(file_path, "a") as f:
-            f.write(json.dumps(data) + "\n")
+        """Serialize a record and queue it for the writer thread."""
+        line = _serialize(data)
+
+        with self._lock:
+            if not self._stopped.is_set():
+                self._queue.put((file_path, line))
+                return
+
+        # Writer is stopping - let it drain, then append synchronously
+        self._writer.join(self.CLOSE_TIMEOUT)
+        fd = os.open(file_path, _OPEN_FLAGS, 0o644)
+        try:
+            _write_lines(fd, [line])
+        finally:
+            os.close(fd)
+
+    def flush(self, timeout: Optional[float] = FLUSH_TIMEOUT) -> bool:
+        """
+        Block until every record queued so far has been written.
+
+        Returns False if the writer didn't get there within timeout.
+        """
+        done = threading.Event()
+        with self._lock:
+            if self._stopped.is_set():
+                return True
+            self._queue.put(done)
+
+        if not done.wait(timeout):
+            logger.warning("Log flush timed out", timeout=timeout)
+            return False
+        return True
+
+    def close(self) -> None:
+        """Write out queued records and stop the writer thread (waits up to CLOSE_TIMEOUT)."""
+        self._finalizer()
+
+        if self._db:
+            self._db.disconnect()
+            self._db = None
 
     # =========================================================================
     # SIGNAL LOGGING
@@ -323,10 +526,10 @@ class TradeLogger:
 
     def get_trades(self, date: Optional[str] = None) -> list[dict]:
         """Get trades for a date (default today)."""
-        if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+        today = date or format_date(datetime.now())
+        trades_file = self.log_dir / f"trades_{today}.jsonl"
 
-        trades_file = self.log_dir / f"trades_{date}.jsonl"
+        self.flush()
 
         if not trades_file.exists():
             return []
@@ -341,10 +544,10 @@ class TradeLogger:
 
     def get_actions(self, date: Optional[str] = None) -> list[dict]:
         """Get actions for a date (default today)."""
-        if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+        today = date or format_date(datetime.now())
+        actions_file = self.log_dir / f"actions_{today}.jsonl"
 
-        actions_file = self.log_dir / f"actions_{date}.jsonl"
+        self.flush()
 
         if not actions_file.exists():
             return []
@@ -357,14 +560,29 @@ class TradeLogger:
 
         return actions
 
+    def count_events(self, event_type: str) -> int:
+        """
+        Count system events of a type in the database.
+
+        Reuses one pooled Database for the logger's lifetime.
+        Returns 0 when no database is configured.
+        """
+        if not self.db_url:
+            return 0
+
+        if self._db is None:
+            self._db = Database(self.db_url)
+        return self._db.count_system_events(event_type)
+
     def get_daily_summary(self, date: Optional[str] = None) -> dict:
         """Get summary statistics for a day."""
-        trades = self.get_trades(date)
-        actions = self.get_actions(date)
+        today = date or format_date(datetime.now())
+        trades = self.get_trades(today)
+        actions = self.get_actions(today)
 
         if not trades:
             return {
-                "date": date or datetime.now().strftime("%Y-%m-%d"),
+                "date": today,
                 "trades": 0,
                 "wins": 0,
                 "losses": 0,
@@ -385,7 +603,7 @@ class TradeLogger:
         avg_loss = sum(e.get("realized_pnl", 0) for e in losses) / len(losses) if losses else 0
 
         return {
-            "date": date or datetime.now().strftime("%Y-%m-%d"),
+            "date": today,
             "trades": len(trades),
             "exits": len(exits),
             "wins": len(wins),
@@ -14,11 +14,15 @@ Scout does NOT:
 - Execute trades (Executor's job)
 """
 
+import heapq
+import secrets
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from itertools import chain, islice
 from typing import Optional, List
-import uuid
 
 from ..core.trade import TradeSignal, ScoutResult
 from ..core.config import Config
@@ -43,6 +47,11 @@ CATALYST_PRIORITIES = {
     "technical": 4,
 }
 
+# Bound once so detectors don't re-hash the key on every signal
+_PRI_VOLUME = CATALYST_PRIORITIES["volume_spike"]
+_PRI_NEWS = CATALYST_PRIORITIES["news"]
+_PRI_TECH = CATALYST_PRIORITIES["technical"]
+
 
 # =============================================================================
 # BASE DETECTOR
@@ -56,20 +65,23 @@ class BaseDetector(ABC):
         self.broker = broker
 
     @abstractmethod
-    def detect(self, ticker: str) -> Optional[TradeSignal]:
+    def detect(self, ticker: str, snapshot: Optional[dict] = None) -> Optional[TradeSignal]:
         """
         Detect catalyst for a single ticker.
 
+        Args:
+            ticker: Symbol to check
+            snapshot: Pre-fetched Broker.get_snapshot() data, if the caller
+                already has it (fetched on demand otherwise)
+
         Returns:
             TradeSignal if catalyst detected, None otherwise
         """
         pass
 
     def _generate_signal_id(self) -> str:
-        """Generate unique signal ID."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        short_uuid = str(uuid.uuid4())[:8]
-        return f"sig_{timestamp}_{short_uuid}"
+        """Generate unique signal ID (epoch seconds + 32 random bits)."""
+        return f"sig_{int(time.time())}_{secrets.token_hex(4)}"
 
 
 # =============================================================================
@@ -79,7 +91,7 @@ class BaseDetector(ABC):
 class VolumeDetector(BaseDetector):
     """Detects unusual volume spikes."""
 
-    def detect(self, ticker: str) -> Optional[TradeSignal]:
+    def detect(self, ticker: str, snapshot: Optional[dict] = None) -> Optional[TradeSignal]:
         """
         Detect volume spike catalyst.
 
@@ -89,22 +101,18 @@ class VolumeDetector(BaseDetector):
         - Clear direction (price vs VWAP)
         """
         try:
-            # Get current stock price
-            current_price = self.broker.get_stock_price(ticker)
-            if not current_price:
-                logger.debug("No price available", ticker=ticker)
+            # Price, volume, VWAP and RSI in one broker call
+            snap = snapshot or self.broker.get_snapshot(ticker)
+            if not snap:
+                logger.debug("No snapshot available", ticker=ticker)
                 return None
 
-            # Get volume data (current and average)
-            volume_data = self.broker.get_volume_data(ticker)
-            if not volume_data:
-                logger.debug("No volume data available", ticker=ticker)
-                return None
-
-            current_volume = volume_data.get("current_volume", 0)
-            avg_volume = volume_data.get("avg_volume", 0)
+            current_price = snap["price"]
+            current_volume = snap.get("current_volume", 0)
+            avg_volume = snap.get("avg_volume", 0)
 
             if not current_volume or not avg_volume:
+                logger.debug("No volume data available", ticker=ticker)
                 return None
 
             # Check absolute volume minimum
@@ -118,14 +126,10 @@ class VolumeDetector(BaseDetector):
             if vol_ratio < spike_threshold:
                 return None
 
-            # Get VWAP to determine direction
-            vwap_data = self.broker.get_vwap(ticker)
-            if not vwap_data:
-                logger.warning("No VWAP data, skipping signal", ticker=ticker)
-                return None
-
-            vwap = vwap_data.get("vwap")
+            # VWAP determines direction
+            vwap = snap.get("vwap")
             if not vwap:
+                logger.warning("No VWAP data, skipping signal", ticker=ticker)
                 return None
 
             # Determine direction
@@ -137,8 +141,8 @@ class VolumeDetector(BaseDetector):
                 # Too close to VWAP, no clear direction
                 return None
 
-            # Get RSI for additional context
-            rsi = self.broker.get_rsi(ticker, period=14)
+            # RSI for additional context
+            rsi = snap.get("rsi")
 
             # Create signal
             signal = TradeSignal(
@@ -153,7 +157,7 @@ class VolumeDetector(BaseDetector):
                 volume=current_volume,
                 avg_volume=avg_volume,
                 rsi=rsi,
-                priority=CATALYST_PRIORITIES["volume_spike"]
+                priority=_PRI_VOLUME
             )
 
             logger.info(
@@ -183,7 +187,7 @@ class NewsDetector(BaseDetector):
         self.social_client = get_social_client()
         self.llm_client = get_llm_client()
 
-    def detect(self, ticker: str) -> Optional[TradeSignal]:
+    def detect(self, ticker: str, snapshot: Optional[dict] = None) -> Optional[TradeSignal]:
         """
         Detect news catalyst.
 
@@ -194,31 +198,24 @@ class NewsDetector(BaseDetector):
         """
         try:
             # Get social data
-            social_data = self.social_client.get_social_data(ticker)
+            # Screening the whole basket - only hit StockTwits for trending symbols
+            social_data = self.social_client.get_social_data(ticker, trending_only=True)
 
             if social_data.total_mentions < 10:
                 # Not enough chatter
                 return None
 
             # Get current price for context
-            current_price = self.broker.get_stock_price(ticker)
+            current_price = snapshot["price"] if snapshot else self.broker.get_stock_price(ticker)
             if not current_price:
                 return None
 
-            # Build LLM prompt
-            news_snippets = []
-
-            # Include StockTwits messages
-            for msg in social_data.stocktwits_messages[:5]:
-                news_snippets.append(f"StockTwits: {msg.get('body', '')}")
-
-            # Include Reddit posts
-            for post in social_data.reddit_posts[:3]:
-                news_snippets.append(f"Reddit: {post.get('title', '')}")
-
-            # Include Alpha Vantage articles
-            for article in social_data.alphavantage_articles[:3]:
-                news_snippets.append(f"News: {article.get('title', '')}")
+            # Build LLM prompt: StockTwits, then Reddit, then Alpha Vantage (max 10)
+            news_snippets = list(islice(chain(
+                (f"StockTwits: {msg.get('body', '')}" for msg in social_data.stocktwits_messages[:5]),
+                (f"Reddit: {post.get('title', '')}" for post in social_data.reddit_posts[:3]),
+                (f"News: {article.get('title', '')}" for article in social_data.alphavantage_articles[:3]),
+            ), 10))
 
             if not news_snippets:
                 return None
@@ -226,7 +223,7 @@ class NewsDetector(BaseDetector):
             # Ask LLM to assess
             prompt = f"""Analyze this social/news data for {ticker} (current price: ${current_price:.2f}):
 
-{chr(10).join(news_snippets[:10])}
+{chr(10).join(news_snippets)}
 
 Is there a significant catalyst that would drive options trading? Consider:
 - Earnings announcements
@@ -250,7 +247,7 @@ Ignore: General market commentary, technical analysis posts, casual mentions."""
                         catalyst_description=f"Trending: {social_data.total_mentions} mentions ({social_data.overall_sentiment})",
                         catalyst_time=datetime.now(),
                         current_price=current_price,
-                        priority=CATALYST_PRIORITIES["news"]
+                        priority=_PRI_NEWS
                     )
                 return None
 
@@ -277,7 +274,7 @@ Ignore: General market commentary, technical analysis posts, casual mentions."""
                 catalyst_description=assessment.get("summary", "News catalyst detected"),
                 catalyst_time=datetime.now(),
                 current_price=current_price,
-                priority=CATALYST_PRIORITIES["news"]
+                priority=_PRI_NEWS
             )
 
             logger.info(
@@ -303,7 +300,7 @@ Ignore: General market commentary, technical analysis posts, casual mentions."""
 class TechnicalDetector(BaseDetector):
     """Detects technical setups (RSI extremes, VWAP reversals)."""
 
-    def detect(self, ticker: str) -> Optional[TradeSignal]:
+    def detect(self, ticker: str, snapshot: Optional[dict] = None) -> Optional[TradeSignal]:
         """
         Detect technical catalyst.
 
@@ -312,12 +309,9 @@ class TechnicalDetector(BaseDetector):
         - Price crossing VWAP with volume confirmation
         """
         try:
-            # Get price and RSI
-            current_price = self.broker.get_stock_price(ticker)
-            if not current_price:
-                return None
-
-            rsi = self.broker.get_rsi(ticker, period=14)
+            # RSI first - most tickers aren't at an extreme, so reject
+            # before spending any other broker calls
+            rsi = snapshot["rsi"] if snapshot else self.broker.get_rsi(ticker, period=14)
             if not rsi:
                 return None
 
@@ -334,14 +328,24 @@ class TechnicalDetector(BaseDetector):
                 # No RSI extreme
                 return None
 
-            # Get VWAP for additional context
-            vwap_data = self.broker.get_vwap(ticker)
-            vwap = vwap_data.get("vwap") if vwap_data else None
+            if snapshot:
+                current_price = snapshot["price"]
+                vwap = snapshot.get("vwap")
+                current_volume = snapshot.get("current_volume", 0)
+                avg_volume = snapshot.get("avg_volume", 0)
+            else:
+                current_price = self.broker.get_stock_price(ticker)
+                if not current_price:
+                    return None
+
+                # Get VWAP for additional context
+                vwap_data = self.broker.get_vwap(ticker)
+                vwap = vwap_data.get("vwap") if vwap_data else None
 
-            # Get volume for confirmation
-            volume_data = self.broker.get_volume_data(ticker)
-            current_volume = volume_data.get("current_volume") if volume_data else 0
-            avg_volume = volume_data.get("avg_volume") if volume_data else 0
+                # Get volume for confirmation
+                volume_data = self.broker.get_volume_data(ticker)
+                current_volume = volume_data.get("current_volume") if volume_data else 0
+                avg_volume = volume_data.get("avg_volume") if volume_data else 0
 
             # Create signal
             signal = TradeSignal(
@@ -356,7 +360,7 @@ class TechnicalDetector(BaseDetector):
                 volume=current_volume,
                 avg_volume=avg_volume,
                 rsi=rsi,
-                priority=CATALYST_PRIORITIES["technical"]
+                priority=_PRI_TECH
             )
 
             logger.info(
@@ -404,7 +408,10 @@ class Scout:
         ]
 
         # Cooldown tracking (prevent re-scanning same ticker)
-        self.cooldown_tracker = {}  # ticker -> cooldown_until timestamp
+        # Heap orders expiries for lazy eviction; the dict is the active set
+        self._cooldown_heap: list[tuple[datetime, str]] = []
+        self._cooldown_until: dict[str, datetime] = {}  # ticker -> latest cooldown_until
+        self._cooldown_lock = threading.Lock()
 
     def scan(self) -> ScoutResult:
         """
@@ -414,91 +421,144 @@ class Scout:
             ScoutResult with detected signals sorted by priority
         """
         start_time = time.time()
-        signals = []
-        warnings = []
+        heap = []  # (-priority, scan order, signal) - drains highest priority first
 
         # Get all tickers from basket (manual + core + categories)
         all_tickers = self.config.basket.all_tickers
 
         if not all_tickers:
-            warnings.append("No tickers in basket")
-            logger.warning("No tickers to scan")
-            return ScoutResult(
-                signals=[],
-                tickers_scanned=0,
-                signals_detected=0,
-                scan_time_ms=0,
-                warnings=warnings
-            )
+            return self._empty_result()
 
         logger.info("Scout scan starting", tickers=len(all_tickers))
 
-        # Scan each ticker
-        for ticker in all_tickers:
-            # Skip if on cooldown
+        to_scan, snapshots = self._prepare_scan(all_tickers)
+
+        # Scan tickers concurrently - detectors are broker/HTTP bound
+        with ThreadPoolExecutor(max_workers=self.config.scout.max_workers) as executor:
+            futures = {
+                executor.submit(self._scan_ticker, ticker, snapshots.get(ticker)): (order, ticker)
+                for order, ticker in to_scan
+            }
+
+            for future in as_completed(futures):
+                order, ticker = futures[future]
+                self._collect(heap, order, ticker, future.result())
+
+        return self._build_result(heap, len(all_tickers), start_time)
+
+    def _empty_result(self) -> ScoutResult:
+        """Result for a scan with nothing in the basket."""
+        logger.warning("No tickers to scan")
+        return ScoutResult(
+            signals=[],
+            tickers_scanned=0,
+            signals_detected=0,
+            scan_time_ms=0,
+            warnings=["No tickers in basket"]
+        )
+
+    def _prepare_scan(self, all_tickers: list[str]) -> tuple[list[tuple[int, str]], dict[str, dict]]:
+        """
+        Drop tickers on cooldown and prefetch market data for the rest.
+
+        Returns:
+            ([(basket order, ticker), ...], {ticker: snapshot})
+        """
+        self._evict_cooldowns()
+
+        to_scan = []
+        for order, ticker in enumerate(all_tickers):
             if self._is_on_cooldown(ticker):
                 logger.debug("Ticker on cooldown, skipping", ticker=ticker)
                 continue
+            to_scan.append((order, ticker))
 
-            # Run detectors until one finds a signal
-            for detector in self.detectors:
-                try:
-                    signal = detector.detect(ticker)
+        # Market data for every ticker up front, in as few requests as the broker allows
+        snapshots = self.broker.get_snapshots_bulk([ticker for _, ticker in to_scan])
 
-                    if signal:
-                        signals.append(signal)
+        return to_scan, snapshots
 
-                        # Set cooldown to prevent immediate re-detection
-                        self._set_cooldown(ticker)
+    def _collect(self, heap: list, order: int, ticker: str, signal: Optional[TradeSignal]) -> None:
+        """Queue a detected signal by priority and put its ticker on cooldown."""
+        if not signal:
+            return
 
-                        # Only one signal per ticker per scan
-                        break
+        heapq.heappush(heap, (-signal.priority, order, signal))
 
-                except Exception as e:
-                    logger.error(
-                        "Detector error",
-                        ticker=ticker,
-                        detector=detector.__class__.__name__,
-                        error=str(e)
-                    )
+        # Set cooldown to prevent immediate re-detection
+        self._set_cooldown(ticker)
 
-        # Sort signals by priority (highest first)
-        signals.sort(key=lambda s: s.priority, reverse=True)
+    def _build_result(self, heap: list, tickers_scanned: int, start_time: float) -> ScoutResult:
+        """Drain the signal heap into a ScoutResult."""
+        # Drain by priority (highest first, ties keep scan order)
+        signals = [heapq.heappop(heap)[2] for _ in range(len(heap))]
 
         elapsed_ms = (time.time() - start_time) * 1000
 
         result = ScoutResult(
             signals=signals,
-            tickers_scanned=len(all_tickers),
+            tickers_scanned=tickers_scanned,
             signals_detected=len(signals),
             scan_time_ms=elapsed_ms,
-            warnings=warnings
+            warnings=[]
         )
 
         logger.info(
             "Scout scan complete",
-            tickers_scanned=len(all_tickers),
+            tickers_scanned=tickers_scanned,
             signals_detected=len(signals),
             scan_time_ms=elapsed_ms
         )
 
         return result
 
-    def _is_on_cooldown(self, ticker: str) -> bool:
-        """Check if ticker is on cooldown."""
-        if ticker not in self.cooldown_tracker:
-            return False
+    def _scan_ticker(self, ticker: str, snapshot: Optional[dict] = None) -> Optional[TradeSignal]:
+        """
+        Run detectors on one ticker until one finds a signal.
 
-        cooldown_until = self.cooldown_tracker[ticker]
-        return datetime.now() < cooldown_until
+        Runs on a worker thread. Only one signal per ticker per scan.
+        """
+        for detector in self.detectors:
+            try:
+                signal = detector.detect(ticker, snapshot=snapshot)
+                if signal:
+                    return signal
+
+            except Exception as e:
+                logger.error(
+                    "Detector error",
+                    ticker=ticker,
+                    detector=detector.__class__.__name__,
+                    error=str(e)
+                )
+
+        return None
+
+    def _is_on_cooldown(self, ticker: str) -> bool:
+        """Check if ticker is on cooldown (expired entries are evicted per scan)."""
+        return ticker in self._cooldown_until
 
     def _set_cooldown(self, ticker: str, minutes: int = 30):
         """Set cooldown for ticker."""
         cooldown_until = datetime.now() + timedelta(minutes=minutes)
-        self.cooldown_tracker[ticker] = cooldown_until
+        with self._cooldown_lock:
+            heapq.heappush(self._cooldown_heap, (cooldown_until, ticker))
+            self._cooldown_until[ticker] = cooldown_until
         logger.debug("Cooldown set", ticker=ticker, until=cooldown_until)
 
+    def _evict_cooldowns(self):
+        """Drop every cooldown that has expired."""
+        now = datetime.now()
+        with self._cooldown_lock:
+            while self._cooldown_heap and self._cooldown_heap[0][0] <= now:
+                cooldown_until, ticker = heapq.heappop(self._cooldown_heap)
+                # Only clear if this was the ticker's latest cooldown
+                if self._cooldown_until.get(ticker) == cooldown_until:
+                    del self._cooldown_until[ticker]
+
     def clear_cooldowns(self):
         """Clear all cooldowns (useful for testing)."""
-        self.cooldown_tracker = {}
+        with self._cooldown_lock:
+            self._cooldown_heap = []
+            self._cooldown_until = {}
         logger.info("All cooldowns cleared")
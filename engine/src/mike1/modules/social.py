@@ -14,16 +14,58 @@ Not supported:
 """
 
 import os
-import requests
+import re
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Optional
 from dataclasses import dataclass, field
+from itertools import islice
 from datetime import datetime
+import httpx
 import structlog
 
+from ..utils.cache import ttl_cache, clear_ttl_cache
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = structlog.get_logger()
 
 
+def _parse_json(response: httpx.Response):
+    """Decode a JSON response body (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern:
+    """
+    Compile keywords into one pattern for a single pass over the text.
+
+    The lookahead makes findall report a keyword at every position, including
+    overlapping ones. Only one alternative can match per position, so
+    len(set(findall(text))) counts distinct keywords only when no keyword is
+    a prefix of another - checked here so a new keyword can't break it.
+    """
+    for kw in keywords:
+        for other in keywords:
+            if kw != other and other.startswith(kw):
+                raise ValueError(f"keyword {kw!r} is a prefix of {other!r}")
+    return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+
 @dataclass
 class SocialData:
     """Aggregated social sentiment data."""
@@ -67,47 +109,99 @@ class SocialClient:
     # Subreddits to search for stock mentions
     TRADING_SUBREDDITS = ["wallstreetbets", "options", "stocks", "investing"]
 
-    # Rate limiting
+    # Reddit keyword sentiment
+    BULLISH_KEYWORDS = (
+        "buy", "calls", "moon", "rocket", "bull", "long",
+        "uppies", "tendies", "gain", "yolo", "diamond", "pump"
+    )
+    BEARISH_KEYWORDS = (
+        "sell", "puts", "crash", "bear", "short",
+        "downies", "loss", "dump", "tank", "rip", "bag"
+    )
+    _BULLISH_RE = _keyword_pattern(BULLISH_KEYWORDS)
+    _BEARISH_RE = _keyword_pattern(BEARISH_KEYWORDS)
+
+    # Rate limiting (shared across threads)
     _last_reddit_call = 0
+    _reddit_lock = threading.Lock()
     REDDIT_RATE_LIMIT = 1.0  # seconds between calls
+    SUBREDDIT_GAP = 0.5      # seconds between subreddit requests
+    REDDIT_BACKOFF = 2.0     # seconds every caller waits after a 429
+
+    # Max wait for any one provider in get_social_data
+    FETCH_TIMEOUT = 20
+
+    # Shared provider pool - room for a few concurrent get_social_data calls
+    FETCH_WORKERS = 6
+
+    # Seconds a provider response is reused for the same symbol
+    CACHE_TTL = 60
+
+    # Seconds the StockTwits trending list is reused
+    TRENDING_TTL = 60
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "MIKE-1 Trading System/1.0"
-        })
+        # One pooled, keep-alive client for every provider (thread-safe)
+        self.client = httpx.Client(
+            http2=HAS_HTTP2,
+            timeout=10,
+            follow_redirects=True,
+            headers={"User-Agent": "MIKE-1 Trading System/1.0"}
+        )
         self.alphavantage_key = os.environ.get("ALPHAVANTAGE_API_KEY")
 
-    def get_social_data(self, symbol: str) -> SocialData:
+        # Providers are independent hosts - fetched concurrently on a pool the
+        # client owns
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.FETCH_WORKERS, thread_name_prefix="social"
+        )
+
+        # StockTwits trending symbols (refreshed every TRENDING_TTL seconds)
+        self._trending: Optional[set[str]] = None
+        self._trending_at: Optional[float] = None
+        self._trending_lock = threading.Lock()
+
+    def get_social_data(self, symbol: str, trending_only: bool = False) -> SocialData:
         """
         Get aggregated social data for a symbol.
 
         Args:
             symbol: Ticker symbol (e.g., "NVDA")
+            trending_only: Skip StockTwits unless the symbol is on its
+                trending list (for screening many tickers; one trending
+                request replaces a per-symbol fetch for the rest)
 
         Returns:
             SocialData with messages and sentiment
         """
         data = SocialData(symbol=symbol)
+        skip_stocktwits = trending_only and not self.is_trending(symbol)
+
+        # Providers are independent hosts - fetch them concurrently
+        executor = self._executor
+        f_st = None if skip_stocktwits else executor.submit(self._get_stocktwits, symbol)
+        f_rd = executor.submit(self._get_reddit, symbol)
+        f_av = executor.submit(self._get_alphavantage, symbol)
 
-        # Get StockTwits data
-        st_data = self._get_stocktwits(symbol)
+        st_data = self._fetch_result(f_st, "stocktwits", symbol) if f_st else None
+        reddit_data = self._fetch_result(f_rd, "reddit", symbol)
+        av_data = self._fetch_result(f_av, "alphavantage", symbol)
+
+        # StockTwits data
         if st_data:
             data.stocktwits_messages = st_data.get("messages", [])
             data.stocktwits_sentiment = st_data.get("sentiment", "neutral")
             data.stocktwits_bullish_pct = st_data.get("bullish_pct", 50)
             data.stocktwits_volume = len(data.stocktwits_messages)
 
-        # Get Reddit data
-        reddit_data = self._get_reddit(symbol)
+        # Reddit data
         if reddit_data:
             data.reddit_posts = reddit_data.get("posts", [])
             data.reddit_sentiment = reddit_data.get("sentiment", "neutral")
             data.reddit_bullish_pct = reddit_data.get("bullish_pct", 50)
             data.reddit_volume = len(data.reddit_posts)
 
-        # Get Alpha Vantage news sentiment (if API key configured)
-        av_data = self._get_alphavantage(symbol)
+        # Alpha Vantage news sentiment (if API key configured)
         if av_data:
             data.alphavantage_articles = av_data.get("articles", [])
             data.alphavantage_sentiment = av_data.get("sentiment", "neutral")
@@ -121,6 +215,28 @@ class SocialClient:
 
         return data
 
+    def clear_cache(self) -> None:
+        """Clear cached provider responses (useful for testing)."""
+        clear_ttl_cache(self)
+        logger.info("Social cache cleared")
+
+    def close(self) -> None:
+        """Shut down the fetch pool and the HTTP client."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.client.close()
+
+    def _fetch_result(self, future, source: str, symbol: str) -> Optional[dict]:
+        """Wait for a provider fetch, treating a timeout or error as no data."""
+        try:
+            return future.result(timeout=self.FETCH_TIMEOUT)
+        except FutureTimeoutError:
+            future.cancel()  # Drop it if it never started
+            logger.warning("Social fetch timed out", source=source, symbol=symbol)
+            return None
+        except Exception as e:
+            logger.error("Social fetch failed", source=source, symbol=symbol, error=str(e))
+            return None
+
     def _aggregate_sentiment(self, data: SocialData) -> str:
         """Combine sentiment from multiple sources."""
         if data.total_mentions == 0:
@@ -146,6 +262,57 @@ class SocialClient:
             return "bearish"
         return "neutral"
 
+    @staticmethod
+    def _iter_stocktwits_messages(raw_msgs):
+        """Yield the fields we keep from raw StockTwits messages."""
+        for msg in raw_msgs:
+            sentiment = None
+            if msg.get("entities", {}).get("sentiment"):
+                sentiment = msg["entities"]["sentiment"].get("basic")
+
+            yield {
+                "id": msg.get("id"),
+                "body": msg.get("body", ""),
+                "sentiment": sentiment,
+                "created_at": msg.get("created_at"),
+                "user": msg.get("user", {}).get("username"),
+                "likes": msg.get("likes", {}).get("total", 0)
+            }
+
+    def _iter_reddit_posts(self, subreddits, hot_posts, symbol_re):
+        """Yield hot posts that mention the symbol, with keyword sentiment."""
+        for subreddit, children in zip(subreddits, hot_posts):
+            for child in children:
+                post_data = child.get("data", {})
+                title = post_data.get("title", "")
+                combined_lower = f"{title} {post_data.get('selftext', '')}".lower()
+
+                # Check if symbol is mentioned
+                if not symbol_re.search(combined_lower):
+                    continue
+
+                # Simple sentiment from keywords (distinct keywords present)
+                post_bullish = len(set(self._BULLISH_RE.findall(combined_lower)))
+                post_bearish = len(set(self._BEARISH_RE.findall(combined_lower)))
+
+                if post_bullish > post_bearish:
+                    sentiment = "bullish"
+                elif post_bearish > post_bullish:
+                    sentiment = "bearish"
+                else:
+                    sentiment = "neutral"
+
+                yield {
+                    "title": title,
+                    "subreddit": subreddit,
+                    "score": post_data.get("score", 0),
+                    "num_comments": post_data.get("num_comments", 0),
+                    "created_utc": post_data.get("created_utc"),
+                    "url": f"https://reddit.com{post_data.get('permalink', '')}",
+                    "sentiment": sentiment
+                }
+
+    @ttl_cache(CACHE_TTL)
     def _get_stocktwits(self, symbol: str, limit: int = 30) -> Optional[dict]:
         """
         Fetch recent StockTwits messages for a symbol.
@@ -157,7 +324,7 @@ class SocialClient:
             url = f"{self.STOCKTWITS_BASE}/streams/symbol/{symbol}.json"
             params = {"limit": limit}
 
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.client.get(url, params=params, timeout=10)
 
             if response.status_code == 404:
                 logger.debug("Symbol not found on StockTwits", symbol=symbol)
@@ -168,29 +335,14 @@ class SocialClient:
                 return None
 
             response.raise_for_status()
-            data = response.json()
-
-            messages = []
-            bullish_count = 0
-            bearish_count = 0
-
-            for msg in data.get("messages", []):
-                sentiment = None
-                if msg.get("entities", {}).get("sentiment"):
-                    sentiment = msg["entities"]["sentiment"].get("basic")
-                    if sentiment == "Bullish":
-                        bullish_count += 1
-                    elif sentiment == "Bearish":
-                        bearish_count += 1
-
-                messages.append({
-                    "id": msg.get("id"),
-                    "body": msg.get("body", ""),
-                    "sentiment": sentiment,
-                    "created_at": msg.get("created_at"),
-                    "user": msg.get("user", {}).get("username"),
-                    "likes": msg.get("likes", {}).get("total", 0)
-                })
+            data = _parse_json(response)
+
+            messages = list(islice(self._iter_stocktwits_messages(data.get("messages", ())), limit))
+
+            # Count labels in one C-level pass
+            label_counts = Counter(m["sentiment"] for m in messages)
+            bullish_count = label_counts["Bullish"]
+            bearish_count = label_counts["Bearish"]
 
             # Calculate overall sentiment
             total_sentiment = bullish_count + bearish_count
@@ -223,10 +375,11 @@ class SocialClient:
                 "bearish_count": bearish_count
             }
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             logger.warning("StockTwits timeout", symbol=symbol)
             return None
-        except requests.exceptions.RequestException as e:
+        except (httpx.HTTPError, ValueError) as e:
+            # ValueError: non-JSON body (e.g. a Cloudflare block page)
             logger.error("StockTwits error", symbol=symbol, error=str(e))
             return None
 
@@ -239,10 +392,10 @@ class SocialClient:
         """
         try:
             url = f"{self.STOCKTWITS_BASE}/trending/symbols.json"
-            response = self.session.get(url, timeout=10)
+            response = self.client.get(url, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = _parse_json(response)
             symbols = [s.get("symbol") for s in data.get("symbols", [])]
 
             logger.debug("Trending symbols fetched", count=len(symbols))
@@ -252,6 +405,24 @@ class SocialClient:
             logger.error("Error fetching trending", error=str(e))
             return []
 
+    def is_trending(self, symbol: str) -> bool:
+        """
+        Check whether a symbol is on the StockTwits trending list.
+
+        The list is fetched at most once per TRENDING_TTL seconds. If it
+        can't be fetched, every symbol counts as trending so callers fall
+        back to fetching normally.
+        """
+        with self._trending_lock:
+            now = time.monotonic()
+            if self._trending_at is None or now - self._trending_at >= self.TRENDING_TTL:
+                trending = self.get_trending()
+                self._trending = set(trending) if trending else None
+                self._trending_at = now
+
+            return self._trending is None or symbol.upper() in self._trending
+
+    @ttl_cache(CACHE_TTL)
     def _get_reddit(self, symbol: str, limit: int = 25) -> Optional[dict]:
         """
         Search Reddit for recent posts mentioning a symbol.
@@ -267,100 +438,30 @@ class SocialClient:
         Returns:
             dict with posts, sentiment, bullish_pct
         """
-        # Rate limiting
-        now = time.time()
-        elapsed = now - SocialClient._last_reddit_call
-        if elapsed < self.REDDIT_RATE_LIMIT:
-            time.sleep(self.REDDIT_RATE_LIMIT - elapsed)
-        SocialClient._last_reddit_call = time.time()
+        self._throttle_reddit(self.REDDIT_RATE_LIMIT)
 
         try:
-            posts = []
-            bullish_keywords = [
-                "buy", "calls", "moon", "rocket", "bull", "long",
-                "uppies", "tendies", "gain", "yolo", "diamond", "pump"
-            ]
-            bearish_keywords = [
-                "sell", "puts", "crash", "bear", "short",
-                "downies", "loss", "dump", "tank", "rip", "bag"
-            ]
-
-            bullish_count = 0
-            bearish_count = 0
+            # $SYMBOL or SYMBOL as a whole word (matched against lowercased text)
+            symbol_lower = symbol.lower()
+            symbol_re = re.compile(rf"\${re.escape(symbol_lower)}\b|\b{re.escape(symbol_lower)}\b")
 
             # Get hot posts and filter for symbol mentions
-            # This works better than search which often returns empty
-            for subreddit in self.TRADING_SUBREDDITS[:2]:
-                try:
-                    # Rate limit between subreddit calls
-                    time.sleep(0.5)
-
-                    url = f"{self.REDDIT_BASE}/r/{subreddit}/hot.json"
-                    params = {"limit": 50}
-
-                    response = self.session.get(url, params=params, timeout=10)
-
-                    if response.status_code == 429:
-                        logger.warning("Reddit rate limited", subreddit=subreddit)
-                        time.sleep(2)
-                        continue
-
-                    if response.status_code != 200:
-                        continue
-
-                    data = response.json()
-                    children = data.get("data", {}).get("children", [])
-
-                    for child in children:
-                        post_data = child.get("data", {})
-                        title = post_data.get("title", "")
-                        selftext = post_data.get("selftext", "")
-                        combined_upper = (title + " " + selftext).upper()
-                        combined_lower = combined_upper.lower()
-
-                        # Check if symbol is mentioned
-                        # Look for $SYMBOL, SYMBOL (with word boundaries), or common variations
-                        symbol_upper = symbol.upper()
-                        if (f"${symbol_upper}" in combined_upper or
-                            f" {symbol_upper} " in f" {combined_upper} " or
-                            combined_upper.startswith(f"{symbol_upper} ") or
-                            combined_upper.endswith(f" {symbol_upper}")):
-
-                            # Simple sentiment from keywords
-                            post_bullish = sum(1 for kw in bullish_keywords if kw in combined_lower)
-                            post_bearish = sum(1 for kw in bearish_keywords if kw in combined_lower)
-
-                            if post_bullish > post_bearish:
-                                sentiment = "bullish"
-                                bullish_count += 1
-                            elif post_bearish > post_bullish:
-                                sentiment = "bearish"
-                                bearish_count += 1
-                            else:
-                                sentiment = "neutral"
-
-                            posts.append({
-                                "title": title,
-                                "subreddit": subreddit,
-                                "score": post_data.get("score", 0),
-                                "num_comments": post_data.get("num_comments", 0),
-                                "created_utc": post_data.get("created_utc"),
-                                "url": f"https://reddit.com{post_data.get('permalink', '')}",
-                                "sentiment": sentiment
-                            })
-
-                            if len(posts) >= limit:
-                                break
-
-                except requests.exceptions.RequestException:
-                    continue
+            # This works better than search which often returns empty.
+            # Listings are fetched one at a time (rate limited) and only
+            # while more posts are needed.
+            subreddits = self.TRADING_SUBREDDITS[:2]
+            hot_posts = map(self._get_subreddit_hot, subreddits)
 
-                if len(posts) >= limit:
-                    break
+            posts = list(islice(self._iter_reddit_posts(subreddits, hot_posts, symbol_re), limit))
 
             if not posts:
                 return None
 
+            # Count labels in one C-level pass
+            label_counts = Counter(p["sentiment"] for p in posts)
+            bullish_count = label_counts["bullish"]
+            bearish_count = label_counts["bearish"]
+
             # Calculate overall sentiment
             total_sentiment = bullish_count + bearish_count
             if total_sentiment > 0:
@@ -396,6 +497,42 @@ class SocialClient:
             logger.error("Reddit error", symbol=symbol, error=str(e))
             return None
 
+    @staticmethod
+    def _throttle_reddit(gap: float) -> None:
+        """Wait until gap seconds have passed since the last Reddit request."""
+        # Lock held while waiting so concurrent callers queue up
+        with SocialClient._reddit_lock:
+            elapsed = time.time() - SocialClient._last_reddit_call
+            if elapsed < gap:
+                time.sleep(gap - elapsed)
+            SocialClient._last_reddit_call = time.time()
+
+    def _get_subreddit_hot(self, subreddit: str) -> list[dict]:
+        """Fetch a subreddit's hot listing. Returns [] on any error."""
+        try:
+            url = f"{self.REDDIT_BASE}/r/{subreddit}/hot.json"
+            params = {"limit": 50}
+
+            self._throttle_reddit(self.SUBREDDIT_GAP)
+            response = self.client.get(url, params=params, timeout=10)
+
+            if response.status_code == 429:
+                # Push every caller's next request past the backoff, then retry once
+                logger.warning("Reddit rate limited", subreddit=subreddit)
+                with SocialClient._reddit_lock:
+                    SocialClient._last_reddit_call = time.time() + self.REDDIT_BACKOFF
+                self._throttle_reddit(self.SUBREDDIT_GAP)
+                response = self.client.get(url, params=params, timeout=10)
+
+            if response.status_code != 200:
+                return []
+
+            return _parse_json(response).get("data", {}).get("children", [])
+
+        except (httpx.HTTPError, ValueError):
+            return []
+
+    @ttl_cache(CACHE_TTL)
     def _get_alphavantage(self, symbol: str, limit: int = 10) -> Optional[dict]:
         """
         Fetch news sentiment from Alpha Vantage.
@@ -422,7 +559,7 @@ class SocialClient:
                 "apikey": self.alphavantage_key
             }
 
-            response = self.session.get(
+            response = self.client.get(
                 self.ALPHAVANTAGE_BASE,
                 params=params,
                 timeout=15
@@ -432,7 +569,7 @@ class SocialClient:
                 logger.warning("Alpha Vantage error", status=response.status_code)
                 return None
 
-            data = response.json()
+            data = _parse_json(response)
 
             # Check for API limit message
             if "Note" in data or "Information" in data:
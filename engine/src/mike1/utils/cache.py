@@ -0,0 +1,48 @@
+"""
+Caching utilities for MIKE-1.
+
+Short-lived, per-instance caches for market and social data fetches.
+"""
+
+import functools
+import time
+from typing import Callable
+
+
+def ttl_cache(seconds: float) -> Callable:
+    """
+    Cache a method's results on its instance for `seconds`.
+
+    Keyed by method name and call arguments. Falsy results (None, 0, {})
+    are not cached, so failed fetches are retried on the next call.
+
+    Usage:
+        @ttl_cache(60)
+        def _get_stocktwits(self, symbol): ...
+
+        clear_ttl_cache(client)  # drop everything cached on client
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = self.__dict__.setdefault("_ttl_cache", {})
+            key = (func.__name__, args, tuple(sorted(kwargs.items())) if kwargs else ())
+
+            now = time.monotonic()
+            hit = cache.get(key)
+            if hit is not None and now - hit[0] < seconds:
+                return hit[1]
+
+            value = func(self, *args, **kwargs)
+            if value:
+                cache[key] = (now, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def clear_ttl_cache(instance) -> None:
+    """Drop every ttl_cache entry stored on an instance."""
+    instance.__dict__.pop("_ttl_cache", None)
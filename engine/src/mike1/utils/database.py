@@ -4,21 +4,301 @@ Database utilities for MIKE-1
 Handles connection to NeonDB (PostgreSQL) and common operations.
 """
 
+import importlib.util
+import itertools
 import os
+import re
+import weakref
+from contextlib import contextmanager
 from typing import Optional, Any
 from datetime import datetime, date
+from pathlib import Path
 import json
 import structlog
 
+# The driver is only located here and imported on first Database use,
+# so importing mike1.utils doesn't pay for it (e.g. dry-run backtests)
+HAS_PSYCOPG2 = importlib.util.find_spec("psycopg2") is not None
+
+ThreadedConnectionPool = RealDictCursor = Json = execute_values = None
+
+
+def _load_psycopg2() -> None:
+    """Import psycopg2 into module globals (idempotent)."""
+    global ThreadedConnectionPool, RealDictCursor, Json, execute_values
+    if Json is None:
+        from psycopg2.pool import ThreadedConnectionPool
+        from psycopg2.extras import RealDictCursor, Json, execute_values
+
+
 try:
-    import psycopg2
-    from psycopg2.extras import RealDictCursor, Json
-    HAS_PSYCOPG2 = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_PSYCOPG2 = False
+    HAS_ORJSON = False
 
 logger = structlog.get_logger()
 
+SCHEMA_PATH = Path(__file__).parent.parent.parent.parent.parent / "db" / "schema.sql"
+
+# Connection pool bounds
+POOL_MIN_CONN = 2
+POOL_MAX_CONN = 10
+
+# Page size for multi-VALUES bulk inserts
+BULK_PAGE_SIZE = 500
+
+TRADE_COLUMNS = (
+    "signal_id", "ticker", "direction",
+    "catalyst_type", "catalyst_description", "catalyst_time",
+    "grade", "score", "score_breakdown",
+    "entry_time", "entry_price", "contracts", "strike", "expiration", "entry_cost",
+    "config_version", "environment",
+)
+
+ACTION_COLUMNS = (
+    "action_type", "trade_id", "position_id", "ticker", "details", "dry_run", "timestamp",
+)
+
+SIGNAL_COLUMNS = (
+    "signal_id", "ticker", "direction",
+    "catalyst_type", "catalyst_description", "catalyst_time",
+    "stock_price", "vwap", "volume", "avg_volume", "rsi",
+    "score", "grade", "score_breakdown", "score_reasons",
+    "was_traded", "rejection_reason",
+)
+
+
+def _insert_sql(table: str, columns: tuple) -> str:
+    """Single-row INSERT ... RETURNING id for the given columns."""
+    placeholders = ", ".join(["%s"] * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) RETURNING id"
+
+
+def _numbered(query: str) -> str:
+    """Rewrite %s placeholders as $1..$n (for PREPARE)."""
+    counter = itertools.count(1)
+    return re.sub(r"%s", lambda _: f"${next(counter)}", query)
+
+
+def _execute_sql(name: str, n_params: int) -> str:
+    """EXECUTE statement for a prepared query with n_params arguments."""
+    return f"EXECUTE {name} ({', '.join(['%s'] * n_params)})"
+
+
+def _bulk_insert_sql(table: str, columns: tuple) -> str:
+    """Multi-VALUES INSERT for execute_values (rows substituted at %s)."""
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES %s RETURNING id"
+
+
+def _json_bytes(value: Any) -> bytes:
+    """Serialize a jsonb value to UTF-8 JSON (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str).encode()
+
+
+def _json_text(value: Any) -> str:
+    """Serialize a jsonb value to text."""
+    return _json_bytes(value).decode()
+
+
+def _pg_json(value: Any) -> "Json":
+    """psycopg2 jsonb parameter serialized with _json_text."""
+    return Json(value, dumps=_json_text)
+
+
+def _trade_row(trade_data: dict) -> tuple:
+    """Build a trades row in TRADE_COLUMNS order."""
+    return (
+        trade_data.get('signal_id'),
+        trade_data.get('ticker'),
+        trade_data.get('direction'),
+        trade_data.get('catalyst_type'),
+        trade_data.get('catalyst_description'),
+        trade_data.get('catalyst_time'),
+        trade_data.get('grade'),
+        trade_data.get('score'),
+        _pg_json(trade_data.get('score_breakdown', {})),
+        trade_data.get('entry_time'),
+        trade_data.get('entry_price'),
+        trade_data.get('contracts'),
+        trade_data.get('strike'),
+        trade_data.get('expiration'),
+        trade_data.get('entry_cost'),
+        trade_data.get('config_version'),
+        trade_data.get('environment', 'paper'),
+    )
+
+
+def _action_row(action_data: dict) -> tuple:
+    """Build an actions row in ACTION_COLUMNS order."""
+    return (
+        action_data.get('action_type'),
+        action_data.get('trade_id'),
+        action_data.get('position_id'),
+        action_data.get('ticker'),
+        _pg_json(action_data.get('details', {})),
+        action_data.get('dry_run', False),
+        action_data.get('timestamp', datetime.now()),
+    )
+
+
+def _signal_row(signal_data: dict) -> tuple:
+    """Build a signals row in SIGNAL_COLUMNS order."""
+    return (
+        signal_data.get('signal_id'),
+        signal_data.get('ticker'),
+        signal_data.get('direction'),
+        signal_data.get('catalyst_type'),
+        signal_data.get('catalyst_description'),
+        signal_data.get('catalyst_time'),
+        signal_data.get('stock_price'),
+        signal_data.get('vwap'),
+        signal_data.get('volume'),
+        signal_data.get('avg_volume'),
+        signal_data.get('rsi'),
+        signal_data.get('score'),
+        signal_data.get('grade'),
+        _pg_json(signal_data.get('score_breakdown', {})),
+        signal_data.get('score_reasons', []),
+        signal_data.get('was_traded', False),
+        signal_data.get('rejection_reason'),
+    )
+
+
+def _exit_params(trade_id: str, exit_data: dict) -> tuple:
+    """Build UPDATE_TRADE_EXIT_SQL parameters."""
+    return (
+        exit_data.get('exit_time'),
+        exit_data.get('exit_price'),
+        exit_data.get('exit_reason'),
+        exit_data.get('exit_proceeds'),
+        exit_data.get('realized_pnl'),
+        exit_data.get('pnl_percent'),
+        exit_data.get('high_water_mark'),
+        exit_data.get('high_water_pnl_percent'),
+        trade_id,
+    )
+
+
+def _daily_stats_row(stats: dict) -> tuple:
+    """Build UPSERT_DAILY_STATS_SQL parameters."""
+    return (
+        stats.get('trade_date'),
+        stats.get('trades_executed', 0),
+        stats.get('trades_won', 0),
+        stats.get('trades_lost', 0),
+        stats.get('realized_pnl', 0),
+        stats.get('gross_profit', 0),
+        stats.get('gross_loss', 0),
+        stats.get('win_rate'),
+        stats.get('avg_win'),
+        stats.get('avg_loss'),
+        stats.get('profit_factor'),
+        stats.get('a_trades', 0),
+        stats.get('a_wins', 0),
+        stats.get('a_pnl', 0),
+        stats.get('b_trades', 0),
+        stats.get('b_wins', 0),
+        stats.get('b_pnl', 0),
+        stats.get('hard_stops', 0),
+        stats.get('trailing_stops', 0),
+        stats.get('dte_closes', 0),
+        stats.get('lockouts', 0),
+    )
+
+
+INSERT_TRADE_SQL = _insert_sql("trades", TRADE_COLUMNS)
+INSERT_ACTION_SQL = _insert_sql("actions", ACTION_COLUMNS)
+INSERT_SIGNAL_SQL = _insert_sql("signals", SIGNAL_COLUMNS)
+BULK_INSERT_TRADE_SQL = _bulk_insert_sql("trades", TRADE_COLUMNS)
+BULK_INSERT_ACTION_SQL = _bulk_insert_sql("actions", ACTION_COLUMNS)
+BULK_INSERT_SIGNAL_SQL = _bulk_insert_sql("signals", SIGNAL_COLUMNS)
+UPDATE_TRADE_EXIT_SQL = """
+    UPDATE trades SET
+        exit_time = %s,
+        exit_price = %s,
+        exit_reason = %s,
+        exit_proceeds = %s,
+        realized_pnl = %s,
+        pnl_percent = %s,
+        high_water_mark = %s,
+        high_water_pnl_percent = %s
+    WHERE id = %s
+"""
+
+UPSERT_DAILY_STATS_SQL = """
+    INSERT INTO daily_stats (
+        trade_date, trades_executed, trades_won, trades_lost,
+        realized_pnl, gross_profit, gross_loss,
+        win_rate, avg_win, avg_loss, profit_factor,
+        a_trades, a_wins, a_pnl,
+        b_trades, b_wins, b_pnl,
+        hard_stops, trailing_stops, dte_closes, lockouts
+    ) VALUES (
+        %s, %s, %s, %s,
+        %s, %s, %s,
+        %s, %s, %s, %s,
+        %s, %s, %s,
+        %s, %s, %s,
+        %s, %s, %s, %s
+    )
+    ON CONFLICT (trade_date) DO UPDATE SET
+        trades_executed = EXCLUDED.trades_executed,
+        trades_won = EXCLUDED.trades_won,
+        trades_lost = EXCLUDED.trades_lost,
+        realized_pnl = EXCLUDED.realized_pnl,
+        gross_profit = EXCLUDED.gross_profit,
+        gross_loss = EXCLUDED.gross_loss,
+        win_rate = EXCLUDED.win_rate,
+        avg_win = EXCLUDED.avg_win,
+        avg_loss = EXCLUDED.avg_loss,
+        profit_factor = EXCLUDED.profit_factor,
+        a_trades = EXCLUDED.a_trades,
+        a_wins = EXCLUDED.a_wins,
+        a_pnl = EXCLUDED.a_pnl,
+        b_trades = EXCLUDED.b_trades,
+        b_wins = EXCLUDED.b_wins,
+        b_pnl = EXCLUDED.b_pnl,
+        hard_stops = EXCLUDED.hard_stops,
+        trailing_stops = EXCLUDED.trailing_stops,
+        dte_closes = EXCLUDED.dte_closes,
+        lockouts = EXCLUDED.lockouts
+"""
+
+# get_trades filter conditions, in bitmask order
+_TRADE_FILTERS = ("entry_time >= %s", "entry_time <= %s", "ticker = %s", "grade = %s")
+
+
+def _get_trades_sql(mask: int) -> str:
+    """get_trades query for the filters whose bits are set in mask."""
+    conditions = [cond for bit, cond in enumerate(_TRADE_FILTERS) if mask & (1 << bit)]
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    return f"""
+        SELECT * FROM trades
+        WHERE {where_clause}
+        ORDER BY entry_time DESC
+        LIMIT %s
+    """
+
+
+# One query per filter combination, indexed by bitmask
+_GET_TRADES_QUERIES = tuple(_get_trades_sql(mask) for mask in range(1 << len(_TRADE_FILTERS)))
+
+# Hot-path statements, prepared once per pooled connection. Each EXECUTE_*
+# form is only used on connections that prepared it; others run the plain SQL.
+PREPARED_STATEMENTS = {
+    "insert_trade": _numbered(INSERT_TRADE_SQL),
+    "insert_action": _numbered(INSERT_ACTION_SQL),
+    "insert_signal": _numbered(INSERT_SIGNAL_SQL),
+    "upsert_daily_stats": _numbered(UPSERT_DAILY_STATS_SQL),
+}
+EXECUTE_INSERT_TRADE_SQL = _execute_sql("insert_trade", len(TRADE_COLUMNS))
+EXECUTE_INSERT_ACTION_SQL = _execute_sql("insert_action", len(ACTION_COLUMNS))
+EXECUTE_INSERT_SIGNAL_SQL = _execute_sql("insert_signal", len(SIGNAL_COLUMNS))
+EXECUTE_UPSERT_DAILY_STATS_SQL = _execute_sql("upsert_daily_stats", UPSERT_DAILY_STATS_SQL.count("%s"))
+
 
 class Database:
     """
@@ -35,18 +315,33 @@ class Database:
 
         self.database_url = database_url or os.environ.get("DATABASE_URL")
         self.enabled = bool(self.database_url)
-        self._conn = None
+        self._pool = None
+        # Connections that hold PREPARED_STATEMENTS (weak, so closed ones drop out)
+        self._prepared_conns = weakref.WeakSet()
+        # Neon's -pooler endpoint is PgBouncer in transaction mode, where a
+        # named statement may not exist on the next transaction's backend
+        self._use_prepared = bool(self.database_url) and "-pooler" not in self.database_url
 
         if not self.enabled:
             logger.warning("DATABASE_URL not set - database features disabled")
+            return
+
+        _load_psycopg2()
 
     def connect(self) -> bool:
-        """Establish database connection."""
+        """Open the connection pool."""
         if not self.enabled:
             return False
 
         try:
-            self._conn = psycopg2.connect(self.database_url)
+            self._pool = ThreadedConnectionPool(
+                POOL_MIN_CONN,
+                POOL_MAX_CONN,
+                dsn=self.database_url,
+                # Keep idle Neon connections from being dropped
+                keepalives=1,
+                keepalives_idle=30,
+            )
             logger.info("Connected to database")
             return True
         except Exception as e:
@@ -54,111 +349,164 @@ class Database:
             return False
 
     def disconnect(self) -> None:
-        """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Close all pooled connections."""
+        if self._pool:
+            self._pool.closeall()
+            self._pool = None
+            self._prepared_conns.clear()
             logger.info("Disconnected from database")
 
-    def _execute(self, query: str, params: tuple = None) -> Optional[list]:
-        """Execute a query and return results."""
-        if not self._conn:
+    @contextmanager
+    def _connection(self, prepare: bool = False):
+        """
+        Borrow a pooled connection for the duration of the block.
+
+        prepare=True first PREPAREs the hot-path statements on it (once).
+        Yields None if the database can't be reached.
+        """
+        if not self._pool:
             if not self.connect():
-                return None
+                yield None
+                return
+
+        conn = self._pool.getconn()
+        try:
+            if prepare:
+                self._prepare(conn)
+            yield conn
+        finally:
+            self._pool.putconn(conn)
+
+    def _prepare(self, conn) -> None:
+        """PREPARE the hot-path statements once per pooled connection."""
+        if not self._use_prepared or conn in self._prepared_conns:
+            return
 
         try:
-            with self._conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(query, params)
-                if cur.description:
-                    return cur.fetchall()
-                self._conn.commit()
-                return []
+            with conn.cursor() as cur:
+                # Clear leftovers from an earlier prepare on this session
+                cur.execute("DEALLOCATE ALL")
+                for name, query in PREPARED_STATEMENTS.items():
+                    cur.execute(f"PREPARE {name} AS {query}")
+            conn.commit()
+            self._prepared_conns.add(conn)
         except Exception as e:
-            logger.error("Query failed", error=str(e), query=query[:100])
-            self._conn.rollback()
-            return None
+            # Don't retry on every borrow; plain statements still work
+            logger.warning("Failed to prepare statements, using plain SQL", error=str(e))
+            conn.rollback()
+            self._use_prepared = False
+
+    def _execute(
+        self,
+        query: str,
+        params: tuple = None,
+        prepared: Optional[str] = None
+    ) -> Optional[list]:
+        """
+        Execute a query and return results.
+
+        prepared is the EXECUTE_* form of query, run instead when the
+        borrowed connection has the statement prepared.
+        """
+        with self._connection(prepare=prepared is not None) as conn:
+            if conn is None:
+                return None
 
-    def _execute_one(self, query: str, params: tuple = None) -> Optional[dict]:
+            if prepared is not None and conn in self._prepared_conns:
+                query = prepared
+
+            try:
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    cur.execute(query, params)
+                    results = cur.fetchall() if cur.description else []
+                conn.commit()
+                return results
+            except Exception as e:
+                logger.error("Query failed", error=str(e), query=query[:100])
+                conn.rollback()
+                # The server may have lost the session's statements; re-prepare next time
+                self._prepared_conns.discard(conn)
+                return None
+
+    def _execute_one(
+        self,
+        query: str,
+        params: tuple = None,
+        prepared: Optional[str] = None
+    ) -> Optional[dict]:
         """Execute a query and return single result."""
-        results = self._execute(query, params)
+        results = self._execute(query, params, prepared)
         if results and len(results) > 0:
-            return dict(results[0])
+            return results[0]
         return None
 
+    def _execute_values(self, query: str, rows: list[tuple]) -> Optional[list]:
+        """
+        Insert many rows in one multi-VALUES statement per page.
+
+        Returns the RETURNING rows, or None on failure.
+        """
+        if not rows:
+            return []
+
+        with self._connection() as conn:
+            if conn is None:
+                return None
+
+            try:
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    results = execute_values(
+                        cur, query, rows, page_size=BULK_PAGE_SIZE, fetch=True
+                    )
+                conn.commit()
+                return results
+            except Exception as e:
+                logger.error("Bulk insert failed", error=str(e), rows=len(rows), query=query[:100])
+                conn.rollback()
+                return None
+
+    def _batch(self, queries: list[tuple[str, Optional[tuple]]]) -> Optional[list[list]]:
+        """
+        Run several queries on one connection and cursor, committing once.
+
+        Returns one result list per query, or None if any query fails.
+        """
+        with self._connection() as conn:
+            if conn is None:
+                return None
+
+            try:
+                results = []
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    for query, params in queries:
+                        cur.execute(query, params)
+                        results.append(cur.fetchall() if cur.description else [])
+                conn.commit()
+                return results
+            except Exception as e:
+                logger.error("Batch failed", error=str(e), queries=len(queries))
+                conn.rollback()
+                return None
+
     # =========================================================================
     # TRADES
     # =========================================================================
 
     def insert_trade(self, trade_data: dict) -> Optional[str]:
         """Insert a new trade record."""
-        query = """
-            INSERT INTO trades (
-                signal_id, ticker, direction,
-                catalyst_type, catalyst_description, catalyst_time,
-                grade, score, score_breakdown,
-                entry_time, entry_price, contracts, strike, expiration, entry_cost,
-                config_version, environment
-            ) VALUES (
-                %s, %s, %s,
-                %s, %s, %s,
-                %s, %s, %s,
-                %s, %s, %s, %s, %s, %s,
-                %s, %s
-            )
-            RETURNING id
-        """
-
-        params = (
-            trade_data.get('signal_id'),
-            trade_data.get('ticker'),
-            trade_data.get('direction'),
-            trade_data.get('catalyst_type'),
-            trade_data.get('catalyst_description'),
-            trade_data.get('catalyst_time'),
-            trade_data.get('grade'),
-            trade_data.get('score'),
-            Json(trade_data.get('score_breakdown', {})),
-            trade_data.get('entry_time'),
-            trade_data.get('entry_price'),
-            trade_data.get('contracts'),
-            trade_data.get('strike'),
-            trade_data.get('expiration'),
-            trade_data.get('entry_cost'),
-            trade_data.get('config_version'),
-            trade_data.get('environment', 'paper'),
+        result = self._execute_one(
+            INSERT_TRADE_SQL, _trade_row(trade_data), EXECUTE_INSERT_TRADE_SQL
         )
-
-        result = self._execute_one(query, params)
         return str(result['id']) if result else None
 
+    def insert_trades_bulk(self, rows: list[dict]) -> list[str]:
+        """Insert many trade records, returning their ids."""
+        results = self._execute_values(BULK_INSERT_TRADE_SQL, [_trade_row(r) for r in rows])
+        return [str(r['id']) for r in results] if results else []
+
     def update_trade_exit(self, trade_id: str, exit_data: dict) -> bool:
         """Update trade with exit information."""
-        query = """
-            UPDATE trades SET
-                exit_time = %s,
-                exit_price = %s,
-                exit_reason = %s,
-                exit_proceeds = %s,
-                realized_pnl = %s,
-                pnl_percent = %s,
-                high_water_mark = %s,
-                high_water_pnl_percent = %s
-            WHERE id = %s
-        """
-
-        params = (
-            exit_data.get('exit_time'),
-            exit_data.get('exit_price'),
-            exit_data.get('exit_reason'),
-            exit_data.get('exit_proceeds'),
-            exit_data.get('realized_pnl'),
-            exit_data.get('pnl_percent'),
-            exit_data.get('high_water_mark'),
-            exit_data.get('high_water_pnl_percent'),
-            trade_id,
-        )
-
-        result = self._execute(query, params)
+        result = self._execute(UPDATE_TRADE_EXIT_SQL, _exit_params(trade_id, exit_data))
         return result is not None
 
     def update_trade_trim(self, trade_id: str, trim_number: int, trim_data: dict) -> bool:
@@ -202,37 +550,17 @@ class Database:
         limit: int = 100
     ) -> list[dict]:
         """Get trades with optional filters."""
-        conditions = []
-        params = []
-
-        if start_date:
-            conditions.append("entry_time >= %s")
-            params.append(start_date)
-
-        if end_date:
-            conditions.append("entry_time <= %s")
-            params.append(end_date)
-
-        if ticker:
-            conditions.append("ticker = %s")
-            params.append(ticker)
-
-        if grade:
-            conditions.append("grade = %s")
-            params.append(grade)
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-        query = f"""
-            SELECT * FROM trades
-            WHERE {where_clause}
-            ORDER BY entry_time DESC
-            LIMIT %s
-        """
-        params.append(limit)
+        filters = (start_date, end_date, ticker, grade)
+        mask = (
+            bool(start_date)
+            | bool(end_date) << 1
+            | bool(ticker) << 2
+            | bool(grade) << 3
+        )
+        params = tuple(value for value in filters if value) + (limit,)
 
-        results = self._execute(query, tuple(params))
-        return [dict(r) for r in results] if results else []
+        results = self._execute(_GET_TRADES_QUERIES[mask], params)
+        return results or []
 
     # =========================================================================
     # ACTIONS
@@ -240,142 +568,41 @@ class Database:
 
     def insert_action(self, action_data: dict) -> Optional[str]:
         """Insert an action log entry."""
-        query = """
-            INSERT INTO actions (
-                action_type, trade_id, position_id, ticker, details, dry_run, timestamp
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-        """
-
-        params = (
-            action_data.get('action_type'),
-            action_data.get('trade_id'),
-            action_data.get('position_id'),
-            action_data.get('ticker'),
-            Json(action_data.get('details', {})),
-            action_data.get('dry_run', False),
-            action_data.get('timestamp', datetime.now()),
+        result = self._execute_one(
+            INSERT_ACTION_SQL, _action_row(action_data), EXECUTE_INSERT_ACTION_SQL
         )
-
-        result = self._execute_one(query, params)
         return str(result['id']) if result else None
 
+    def insert_actions_bulk(self, rows: list[dict]) -> list[str]:
+        """Insert many action log entries, returning their ids."""
+        results = self._execute_values(BULK_INSERT_ACTION_SQL, [_action_row(r) for r in rows])
+        return [str(r['id']) for r in results] if results else []
+
     # =========================================================================
     # SIGNALS
     # =========================================================================
 
     def insert_signal(self, signal_data: dict) -> Optional[str]:
         """Insert a signal record."""
-        query = """
-            INSERT INTO signals (
-                signal_id, ticker, direction,
-                catalyst_type, catalyst_description, catalyst_time,
-                stock_price, vwap, volume, avg_volume, rsi,
-                score, grade, score_breakdown, score_reasons,
-                was_traded, rejection_reason
-            ) VALUES (
-                %s, %s, %s,
-                %s, %s, %s,
-                %s, %s, %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s
-            )
-            RETURNING id
-        """
-
-        params = (
-            signal_data.get('signal_id'),
-            signal_data.get('ticker'),
-            signal_data.get('direction'),
-            signal_data.get('catalyst_type'),
-            signal_data.get('catalyst_description'),
-            signal_data.get('catalyst_time'),
-            signal_data.get('stock_price'),
-            signal_data.get('vwap'),
-            signal_data.get('volume'),
-            signal_data.get('avg_volume'),
-            signal_data.get('rsi'),
-            signal_data.get('score'),
-            signal_data.get('grade'),
-            Json(signal_data.get('score_breakdown', {})),
-            signal_data.get('score_reasons', []),
-            signal_data.get('was_traded', False),
-            signal_data.get('rejection_reason'),
+        result = self._execute_one(
+            INSERT_SIGNAL_SQL, _signal_row(signal_data), EXECUTE_INSERT_SIGNAL_SQL
         )
-
-        result = self._execute_one(query, params)
         return str(result['id']) if result else None
 
+    def insert_signals_bulk(self, rows: list[dict]) -> list[str]:
+        """Insert many signal records, returning their ids."""
+        results = self._execute_values(BULK_INSERT_SIGNAL_SQL, [_signal_row(r) for r in rows])
+        return [str(r['id']) for r in results] if results else []
+
     # =========================================================================
     # DAILY STATS
     # =========================================================================
 
     def upsert_daily_stats(self, stats: dict) -> bool:
         """Update or insert daily statistics."""
-        query = """
-            INSERT INTO daily_stats (
-                trade_date, trades_executed, trades_won, trades_lost,
-                realized_pnl, gross_profit, gross_loss,
-                win_rate, avg_win, avg_loss, profit_factor,
-                a_trades, a_wins, a_pnl,
-                b_trades, b_wins, b_pnl,
-                hard_stops, trailing_stops, dte_closes, lockouts
-            ) VALUES (
-                %s, %s, %s, %s,
-                %s, %s, %s,
-                %s, %s, %s, %s,
-                %s, %s, %s,
-                %s, %s, %s,
-                %s, %s, %s, %s
-            )
-            ON CONFLICT (trade_date) DO UPDATE SET
-                trades_executed = EXCLUDED.trades_executed,
-                trades_won = EXCLUDED.trades_won,
-                trades_lost = EXCLUDED.trades_lost,
-                realized_pnl = EXCLUDED.realized_pnl,
-                gross_profit = EXCLUDED.gross_profit,
-                gross_loss = EXCLUDED.gross_loss,
-                win_rate = EXCLUDED.win_rate,
-                avg_win = EXCLUDED.avg_win,
-                avg_loss = EXCLUDED.avg_loss,
-                profit_factor = EXCLUDED.profit_factor,
-                a_trades = EXCLUDED.a_trades,
-                a_wins = EXCLUDED.a_wins,
-                a_pnl = EXCLUDED.a_pnl,
-                b_trades = EXCLUDED.b_trades,
-                b_wins = EXCLUDED.b_wins,
-                b_pnl = EXCLUDED.b_pnl,
-                hard_stops = EXCLUDED.hard_stops,
-                trailing_stops = EXCLUDED.trailing_stops,
-                dte_closes = EXCLUDED.dte_closes,
-                lockouts = EXCLUDED.lockouts
-        """
-
-        params = (
-            stats.get('trade_date'),
-            stats.get('trades_executed', 0),
-            stats.get('trades_won', 0),
-            stats.get('trades_lost', 0),
-            stats.get('realized_pnl', 0),
-            stats.get('gross_profit', 0),
-            stats.get('gross_loss', 0),
-            stats.get('win_rate'),
-            stats.get('avg_win'),
-            stats.get('avg_loss'),
-            stats.get('profit_factor'),
-            stats.get('a_trades', 0),
-            stats.get('a_wins', 0),
-            stats.get('a_pnl', 0),
-            stats.get('b_trades', 0),
-            stats.get('b_wins', 0),
-            stats.get('b_pnl', 0),
-            stats.get('hard_stops', 0),
-            stats.get('trailing_stops', 0),
-            stats.get('dte_closes', 0),
-            stats.get('lockouts', 0),
+        result = self._execute(
+            UPSERT_DAILY_STATS_SQL, _daily_stats_row(stats), EXECUTE_UPSERT_DAILY_STATS_SQL
         )
-
-        result = self._execute(query, params)
         return result is not None
 
     def get_daily_stats(self, trade_date: date) -> Optional[dict]:
@@ -395,9 +622,15 @@ class Database:
             RETURNING id
         """
 
-        result = self._execute_one(query, (event_type, Json(details or {})))
+        result = self._execute_one(query, (event_type, _pg_json(details or {})))
         return str(result['id']) if result else None
 
+    def count_system_events(self, event_type: str) -> int:
+        """Count system events of a given type."""
+        query = "SELECT COUNT(*) AS count FROM system_events WHERE event_type = %s"
+        result = self._execute_one(query, (event_type,))
+        return result['count'] if result else 0
+
     # =========================================================================
     # ANALYTICS
     # =========================================================================
@@ -406,26 +639,47 @@ class Database:
         """Get performance breakdown by grade."""
         query = "SELECT * FROM performance_by_grade"
         results = self._execute(query)
-        return [dict(r) for r in results] if results else []
+        return results or []
 
     def get_performance_by_ticker(self) -> list[dict]:
         """Get performance breakdown by ticker."""
         query = "SELECT * FROM performance_by_ticker"
         results = self._execute(query)
-        return [dict(r) for r in results] if results else []
+        return results or []
 
     def get_exit_analysis(self) -> list[dict]:
         """Get exit reason analysis."""
         query = "SELECT * FROM exit_analysis"
         results = self._execute(query)
-        return [dict(r) for r in results] if results else []
+        return results or []
 
     def get_recent_trades(self, limit: int = 50) -> list[dict]:
         """Get recent trades."""
-        query = f"SELECT * FROM recent_trades LIMIT {limit}"
-        results = self._execute(query)
-        return [dict(r) for r in results] if results else []
+        query = "SELECT * FROM recent_trades LIMIT %s"
+        results = self._execute(query, (limit,))
+        return results or []
+
+    def get_dashboard(self, recent_limit: int = 50) -> dict[str, list[dict]]:
+        """
+        Get all analytics views in one round of queries on a single cursor.
 
+        Returns:
+            dict with by_grade, by_ticker, exit_analysis and recent_trades
+        """
+        results = self._batch([
+            ("SELECT * FROM performance_by_grade", None),
+            ("SELECT * FROM performance_by_ticker", None),
+            ("SELECT * FROM exit_analysis", None),
+            ("SELECT * FROM recent_trades LIMIT %s", (recent_limit,)),
+        ]) or [[], [], [], []]
+
+        by_grade, by_ticker, exit_analysis, recent_trades = results
+        return {
+            "by_grade": by_grade,
+            "by_ticker": by_ticker,
+            "exit_analysis": exit_analysis,
+            "recent_trades": recent_trades,
+        }
 
 # Global database instance
 _db: Optional[Database] = None
@@ -445,13 +699,8 @@ def init_schema(database_url: str) -> bool:
 
     Run this once to set up the tables.
     """
-    import os
-    from pathlib import Path
-
-    schema_path = Path(__file__).parent.parent.parent.parent.parent / "db" / "schema.sql"
-
-    if not schema_path.exists():
-        logger.error("Schema file not found", path=str(schema_path))
+    if not SCHEMA_PATH.exists():
+        logger.error("Schema file not found", path=str(SCHEMA_PATH))
         return False
 
     db = Database(database_url)
@@ -459,12 +708,13 @@ def init_schema(database_url: str) -> bool:
         return False
 
     try:
-        with open(schema_path, 'r') as f:
+        with open(SCHEMA_PATH, 'r') as f:
             schema_sql = f.read()
 
-        with db._conn.cursor() as cur:
-            cur.execute(schema_sql)
-            db._conn.commit()
+        with db._connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(schema_sql)
+            conn.commit()
 
         logger.info("Database schema initialized successfully")
         return True
@@ -4,9 +4,47 @@ Date utilities for MIKE-1.
 Handles expiration date calculations for options trading.
 """
 
-from datetime import datetime, timedelta
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import List
 
+# How long cached_now() reuses a reading (about one strategy tick)
+NOW_CACHE_SECONDS = 1.0
+
+# (monotonic stamp, datetime) of the last cached_now() reading
+_now_cache: tuple = (float("-inf"), None)
+
+# Below this many expirations the plain loop beats NumPy's setup cost
+VECTORIZE_MIN_EXPIRATIONS = 8
+
+
+def cached_now() -> datetime:
+    """
+    datetime.now(), reused for up to NOW_CACHE_SECONDS.
+
+    Date helpers default to this so a burst of calls in one tick
+    reads the clock once.
+    """
+    global _now_cache
+    stamp, now = _now_cache
+    mono = time.monotonic()
+    if mono - stamp >= NOW_CACHE_SECONDS:
+        now = datetime.now()
+        _now_cache = (mono, now)
+    return now
+
+
+def format_date(d: date) -> str:
+    """YYYY-MM-DD without going through strftime's locale layer."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+
+
+@lru_cache(maxsize=1024)
+def _parse_expiration(expiration: str) -> datetime:
+    """Parse a YYYY-MM-DD expiration (cached - chains repeat the same few dates)."""
+    return datetime.strptime(expiration, "%Y-%m-%d")
+
 
 def get_next_fridays(count: int = 4, from_date: datetime = None) -> List[str]:
     """
@@ -20,24 +58,31 @@ def get_next_fridays(count: int = 4, from_date: datetime = None) -> List[str]:
         List of YYYY-MM-DD strings for next N Fridays
     """
     if from_date is None:
-        from_date = datetime.now()
+        from_date = cached_now()
+
+    # Result depends only on the calendar day, so intraday calls share a cache entry
+    return list(_next_fridays(count, from_date.date()))
 
+
+@lru_cache(maxsize=64)
+def _next_fridays(count: int, start: date) -> tuple:
+    """Next `count` Fridays after `start` as YYYY-MM-DD strings."""
     fridays = []
-    current = from_date
+    current = start
 
     while len(fridays) < count:
         # Find next Friday
         days_until_friday = (4 - current.weekday()) % 7
-        if days_until_friday == 0 and current.date() != from_date.date():
+        if days_until_friday == 0 and current != start:
             # Already on a Friday and not the start date
             next_friday = current
         else:
             next_friday = current + timedelta(days=days_until_friday if days_until_friday > 0 else 7)
 
-        fridays.append(next_friday.strftime("%Y-%m-%d"))
+        fridays.append(format_date(next_friday))
         current = next_friday + timedelta(days=1)
 
-    return fridays
+    return tuple(fridays)
 
 
 def calculate_dte(expiration: str, from_date: datetime = None) -> int:
@@ -52,9 +97,9 @@ def calculate_dte(expiration: str, from_date: datetime = None) -> int:
         Number of days until expiration
     """
     if from_date is None:
-        from_date = datetime.now()
+        from_date = cached_now()
 
-    exp_date = datetime.strptime(expiration, "%Y-%m-%d")
+    exp_date = _parse_expiration(expiration)
     delta = exp_date - from_date
     return delta.days
 
@@ -77,13 +122,31 @@ def filter_expirations_by_dte(
     Returns:
         Filtered list of expiration dates within DTE range
     """
-    filtered = []
-    for exp in expirations:
-        dte = calculate_dte(exp, from_date)
-        if min_dte <= dte <= max_dte:
-            filtered.append(exp)
+    if len(expirations) < VECTORIZE_MIN_EXPIRATIONS:
+        filtered = []
+        for exp in expirations:
+            dte = calculate_dte(exp, from_date)
+            if min_dte <= dte <= max_dte:
+                filtered.append(exp)
+
+        return filtered
+
+    import numpy as np
+
+    if from_date is None:
+        from_date = cached_now()
+
+    # Whole-day difference, less one if from_date is past midnight
+    # (matches calculate_dte's floor of the timedelta)
+    start = from_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    dte = (
+        np.array(expirations, dtype="datetime64[D]") - np.datetime64(start.date(), "D")
+    ).astype(np.int64)
+    if from_date > start:
+        dte -= 1
 
-    return filtered
+    mask = (dte >= min_dte) & (dte <= max_dte)
+    return [expirations[i] for i in np.flatnonzero(mask)]
 
 
 def is_market_open(check_time: datetime = None) -> bool:
@@ -100,7 +163,7 @@ def is_market_open(check_time: datetime = None) -> bool:
         This is a simplified check. Does not account for holidays.
     """
     if check_time is None:
-        check_time = datetime.now()
+        check_time = cached_now()
 
     # Check if weekend
     if check_time.weekday() >= 5:  # Saturday=5, Sunday=6
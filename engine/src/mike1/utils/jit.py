@@ -0,0 +1,24 @@
+"""
+Optional Numba JIT for MIKE-1.
+
+Numerical kernels are decorated with njit from here. When numba is not
+installed the decorator is a no-op and the kernels run as plain Python.
+"""
+
+import structlog
+
+logger = structlog.get_logger()
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    # Module import runs once, so this is logged once per process
+    logger.warning("numba not installed - numerical kernels run as plain Python")
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
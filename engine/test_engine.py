@@ -19,11 +19,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 
+import logging
 import structlog
 structlog.configure(
     processors=[
         structlog.dev.ConsoleRenderer(colors=True)
-    ]
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+    cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger()
@@ -110,9 +113,11 @@ def test_full_pipeline():
     # Simulate price going up
     test_prices = [2.75, 3.00, 3.25, 3.10, 3.50]  # Up with a pullback
 
-    for price in test_prices:
-        position.update_price(price)
-        print(f"  Price: ${price:.2f} | P&L: {position.pnl_percent:.1f}% | HWM: ${position.high_water_mark:.2f} ({position.high_water_pnl_percent:.1f}%)")
+    replay = position.replay(test_prices)
+    for price, pnl, hwm, hwm_pnl in zip(
+        replay.prices, replay.pnl_percent, replay.high_water_mark, replay.high_water_pnl_percent
+    ):
+        print(f"  Price: ${price:.2f} | P&L: {pnl:.1f}% | HWM: ${hwm:.2f} ({hwm_pnl:.1f}%)")
 
     print()
 
@@ -144,7 +149,7 @@ def test_full_pipeline():
     db_url = os.getenv("DATABASE_URL")
     if db_url:
         try:
-            trade_logger = TradeLogger(db_url)
+            trade_logger = TradeLogger(db_url=db_url)
 
             # Log a system event
             trade_logger.log_system_event("engine_test", {
@@ -155,14 +160,9 @@ def test_full_pipeline():
             print("  System event logged ✓")
 
             # Check if it was logged
-            import psycopg2
-            conn = psycopg2.connect(db_url)
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM system_events WHERE event_type = 'engine_test'")
-            count = cursor.fetchone()[0]
+            count = trade_logger.count_events("engine_test")
             print(f"  System events in DB: {count}")
-            cursor.close()
-            conn.close()
+            trade_logger.close()
 
         except Exception as e:
             print(f"  Database error: {e}")
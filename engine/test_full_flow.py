@@ -20,17 +20,49 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 
+import logging
 import structlog
 structlog.configure(
     processors=[
         structlog.dev.ConsoleRenderer(colors=True)
-    ]
+    ],
+    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
+    cache_logger_on_first_use=True,
 )
 
 from mike1.core.config import Config
 from mike1.core.risk_governor import RiskGovernor
 from mike1.modules.broker import PaperBroker
-from mike1.modules.executor import Executor
+from mike1.modules.executor import Executor, ExitAction
+
+
+def _simulate_and_check(
+    broker: PaperBroker,
+    executor: Executor,
+    contract_id: int,
+    new_price: float
+) -> list[ExitAction]:
+    """
+    Move one contract's price and run an executor tick.
+
+    Uses the interned-contract fast path (simulate_price_change_by_id).
+    """
+    broker.simulate_price_change_by_id(contract_id, new_price)
+    return executor.tick()
+
+
+def _print_actions(actions: list[ExitAction], details: bool = True) -> None:
+    """Print the actions from one executor tick."""
+    if not actions:
+        print("  No actions triggered")
+    for action in actions:
+        print(f"  ACTION: {action.type.upper()}")
+        if details:
+            print(f"    Ticker: {action.ticker}")
+            print(f"    Contracts: {action.contracts}")
+            print(f"    Price: ${action.price:.2f}")
+        print(f"    Executed: {action.executed}")
+    print()
 
 
 def test_full_flow():
@@ -82,6 +114,8 @@ def test_full_flow():
     print(f"  Order ID: {result.order_id}")
     print()
 
+    nvda_call = broker.intern_contract("NVDA", 140.0, "2026-01-17", "call")
+
     # Sync executor with broker
     executor.sync_positions()
     print(f"  Executor tracking: {len(executor.state.positions)} position(s)")
@@ -97,26 +131,11 @@ def test_full_flow():
     # Calculate price for +25%
     trim_1_price = entry_price * 1.25  # $2.50
 
-    # Simulate price change
-    broker.simulate_price_change("NVDA", 140.0, "2026-01-17", "call", trim_1_price)
-
-    # Run executor check
     print(f"  New price: ${trim_1_price:.2f} (+25%)")
     print(f"  Running executor check...")
 
-    executor.sync_positions()
-    actions = executor.check_exits()
-
-    if actions:
-        for action in actions:
-            print(f"  ACTION: {action['type'].upper()}")
-            print(f"    Ticker: {action['ticker']}")
-            print(f"    Contracts: {action['contracts']}")
-            print(f"    Price: ${action['price']:.2f}")
-            print(f"    Executed: {action['executed']}")
-    else:
-        print("  No actions triggered")
-    print()
+    actions = _simulate_and_check(broker, executor, nvda_call, trim_1_price)
+    _print_actions(actions)
 
     # Check remaining position
     positions = broker.get_option_positions()
@@ -135,25 +154,11 @@ def test_full_flow():
     # Calculate price for +50%
     trim_2_price = entry_price * 1.50  # $3.00
 
-    # Simulate price change
-    broker.simulate_price_change("NVDA", 140.0, "2026-01-17", "call", trim_2_price)
-
     print(f"  New price: ${trim_2_price:.2f} (+50%)")
     print(f"  Running executor check...")
 
-    executor.sync_positions()
-    actions = executor.check_exits()
-
-    if actions:
-        for action in actions:
-            print(f"  ACTION: {action['type'].upper()}")
-            print(f"    Ticker: {action['ticker']}")
-            print(f"    Contracts: {action['contracts']}")
-            print(f"    Price: ${action['price']:.2f}")
-            print(f"    Executed: {action['executed']}")
-    else:
-        print("  No actions triggered")
-    print()
+    actions = _simulate_and_check(broker, executor, nvda_call, trim_2_price)
+    _print_actions(actions)
 
     # =========================================================================
     # STEP 4: Check final state
@@ -172,9 +177,9 @@ def test_full_flow():
     print(f"  Total orders: {summary['total_orders']}")
     print()
 
-    # Show order history
+    # Show order history (most recent orders only)
     print("Order History:")
-    for order in broker.order_history:
+    for order in broker.iter_order_history(tail=50):
         if order['type'] == 'buy':
             print(f"  BUY  {order['quantity']}x {order['symbol']} @ ${order['price']:.2f}")
         else:
@@ -198,24 +203,18 @@ def test_full_flow():
         price=2.00
     )
     print(f"  Opened new position: AMD $150 Call @ $2.00")
+    amd_call = broker.intern_contract("AMD", 150.0, "2026-01-17", "call")
 
     executor.sync_positions()
 
     # Simulate -50% loss
     stop_price = 1.00  # -50%
-    broker.simulate_price_change("AMD", 150.0, "2026-01-17", "call", stop_price)
 
     print(f"  Price crashed to ${stop_price:.2f} (-50%)")
     print(f"  Running executor check...")
 
-    executor.sync_positions()
-    actions = executor.check_exits()
-
-    if actions:
-        for action in actions:
-            print(f"  ACTION: {action['type'].upper()}")
-            print(f"    Executed: {action['executed']}")
-    print()
+    actions = _simulate_and_check(broker, executor, amd_call, stop_price)
+    _print_actions(actions, details=False)
 
     # Final summary
     print("=" * 60)
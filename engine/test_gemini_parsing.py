@@ -9,108 +9,136 @@ Tests the LLM client's ability to:
 """
 
 import os
+import re
 import sys
 import json
+from bisect import bisect_right
+from functools import lru_cache
+
+import pytest
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# ```info\n...``` wrapper around the whole response. The info string runs to
+# the end of the line (tag, trailing spaces, CR), so the body may end in "\r"
+# but JSON treats that as whitespace.
+_FENCE_RE = re.compile(r"\A```[^\n]*\n(.*?)\n?```\s*\Z", re.S)
+
+# Whitespace JSON allows before a value
+_JSON_WHITESPACE = " \t\r\n"
+
+
+def _is_bare_json_object(text: str) -> bool:
+    """True if the first non-whitespace character is '{' (nothing to unwrap)."""
+    for ch in text:
+        if ch not in _JSON_WHITESPACE:
+            return ch == "{"
+    return False
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 
-def test_json_parsing():
+JSON_CASES = [
+    # 1. Clean JSON
+    {
+        "name": "Clean JSON",
+        "input": '{"has_catalyst": true, "mention_type": "primary", "sentiment": "bullish", "confidence": 0.85, "summary": "Strong earnings beat", "reasoning": "Revenue exceeded expectations"}',
+        "should_pass": True,
+        "expected": {"has_catalyst": True, "sentiment": "bullish", "confidence": 0.85}
+    },
+    # 2. Markdown code block with json tag
+    {
+        "name": "Markdown code block (json)",
+        "input": '```json\n{"has_catalyst": true, "mention_type": "secondary", "sentiment": "neutral", "confidence": 0.5, "summary": "Sector rotation", "reasoning": "General market trend"}\n```',
+        "should_pass": True,
+        "expected": {"has_catalyst": True, "sentiment": "neutral", "confidence": 0.5}
+    },
+    # 3. Markdown code block without tag
+    {
+        "name": "Markdown code block (no tag)",
+        "input": '```\n{"has_catalyst": false, "mention_type": "passing", "sentiment": "bearish", "confidence": 0.2, "summary": "No catalyst", "reasoning": "No news"}\n```',
+        "should_pass": True,
+        "expected": {"has_catalyst": False, "sentiment": "bearish", "confidence": 0.2}
+    },
+    # 3a. Trailing space after the tag
+    {
+        "name": "Markdown code block (json + trailing space)",
+        "input": '```json \n{"has_catalyst": true, "mention_type": "primary", "sentiment": "bullish", "confidence": 0.7, "summary": "Guidance raise", "reasoning": "Raised outlook"}\n```',
+        "should_pass": True,
+        "expected": {"has_catalyst": True, "sentiment": "bullish", "confidence": 0.7}
+    },
+    # 3b. CRLF line endings
+    {
+        "name": "Markdown code block (CRLF)",
+        "input": '```json\r\n{"has_catalyst": true, "mention_type": "primary", "sentiment": "bearish", "confidence": 0.8, "summary": "Guidance cut", "reasoning": "Lowered outlook"}\r\n```\r\n',
+        "should_pass": True,
+        "expected": {"has_catalyst": True, "sentiment": "bearish", "confidence": 0.8}
+    },
+    # 3c. Tags with digits and hyphens
+    {
+        "name": "Markdown code block (json5 tag)",
+        "input": '```json5\n{"has_catalyst": false, "mention_type": "passing", "sentiment": "neutral", "confidence": 0.1, "summary": "No news", "reasoning": "Nothing new"}\n```',
+        "should_pass": True,
+        "expected": {"has_catalyst": False, "sentiment": "neutral", "confidence": 0.1}
+    },
+    {
+        "name": "Markdown code block (hyphenated tag)",
+        "input": '```application-json\n{"has_catalyst": true, "mention_type": "secondary", "sentiment": "bullish", "confidence": 0.6, "summary": "Peer beat", "reasoning": "Sector read-through"}\n```',
+        "should_pass": True,
+        "expected": {"has_catalyst": True, "sentiment": "bullish", "confidence": 0.6}
+    },
+    # 4. JSON with extra whitespace
+    {
+        "name": "JSON with whitespace",
+        "input": '\n\n  {"has_catalyst": true, "mention_type": "primary", "sentiment": "bullish", "confidence": 0.9, "summary": "Test", "reasoning": "Test"}  \n\n',
+        "should_pass": True,
+        "expected": {"has_catalyst": True, "confidence": 0.9}
+    },
+    # 5. Invalid JSON
+    {
+        "name": "Invalid JSON (missing quote)",
+        "input": '{"has_catalyst": true, sentiment: "bullish"}',
+        "should_pass": False,
+        "expected": None
+    },
+    # 6. Empty response
+    {
+        "name": "Empty response",
+        "input": '',
+        "should_pass": False,
+        "expected": None
+    },
+    # 7. Not JSON at all
+    {
+        "name": "Plain text (not JSON)",
+        "input": 'The sentiment is bullish with high confidence.',
+        "should_pass": False,
+        "expected": None
+    },
+]
+
+
+def _case_id(case: dict) -> str:
+    return case["name"]
+
+
+@pytest.mark.parametrize("case", JSON_CASES, ids=_case_id)
+def test_json_parsing(case):
     """Test parsing various JSON response formats."""
-    print("=" * 60)
-    print("TEST: Gemini Response Parsing")
-    print("=" * 60)
-    print()
-
-    # Test cases
-    test_cases = [
-        # 1. Clean JSON
-        {
-            "name": "Clean JSON",
-            "input": '{"has_catalyst": true, "mention_type": "primary", "sentiment": "bullish", "confidence": 0.85, "summary": "Strong earnings beat", "reasoning": "Revenue exceeded expectations"}',
-            "should_pass": True,
-            "expected": {"has_catalyst": True, "sentiment": "bullish", "confidence": 0.85}
-        },
-        # 2. Markdown code block with json tag
-        {
-            "name": "Markdown code block (json)",
-            "input": '```json\n{"has_catalyst": true, "mention_type": "secondary", "sentiment": "neutral", "confidence": 0.5, "summary": "Sector rotation", "reasoning": "General market trend"}\n```',
-            "should_pass": True,
-            "expected": {"has_catalyst": True, "sentiment": "neutral", "confidence": 0.5}
-        },
-        # 3. Markdown code block without tag
-        {
-            "name": "Markdown code block (no tag)",
-            "input": '```\n{"has_catalyst": false, "mention_type": "passing", "sentiment": "bearish", "confidence": 0.2, "summary": "No catalyst", "reasoning": "No news"}\n```',
-            "should_pass": True,
-            "expected": {"has_catalyst": False, "sentiment": "bearish", "confidence": 0.2}
-        },
-        # 4. JSON with extra whitespace
-        {
-            "name": "JSON with whitespace",
-            "input": '\n\n  {"has_catalyst": true, "mention_type": "primary", "sentiment": "bullish", "confidence": 0.9, "summary": "Test", "reasoning": "Test"}  \n\n',
-            "should_pass": True,
-            "expected": {"has_catalyst": True, "confidence": 0.9}
-        },
-        # 5. Invalid JSON
-        {
-            "name": "Invalid JSON (missing quote)",
-            "input": '{"has_catalyst": true, sentiment: "bullish"}',
-            "should_pass": False,
-            "expected": None
-        },
-        # 6. Empty response
-        {
-            "name": "Empty response",
-            "input": '',
-            "should_pass": False,
-            "expected": None
-        },
-        # 7. Not JSON at all
-        {
-            "name": "Plain text (not JSON)",
-            "input": 'The sentiment is bullish with high confidence.',
-            "should_pass": False,
-            "expected": None
-        },
-    ]
-
-    passed = 0
-    failed = 0
+    result = parse_gemini_response(case["input"])
 
-    for case in test_cases:
-        print(f"[TEST] {case['name']}")
-        result = parse_gemini_response(case['input'])
-
-        if case['should_pass']:
-            if result is None:
-                print(f"  FAIL: Expected valid result, got None")
-                failed += 1
-            else:
-                # Check expected fields
-                all_match = True
-                for key, expected_val in case['expected'].items():
-                    actual_val = result.get(key)
-                    if actual_val != expected_val:
-                        print(f"  FAIL: {key} = {actual_val}, expected {expected_val}")
-                        all_match = False
-                        failed += 1
-                        break
-                if all_match:
-                    print(f"  PASS: Correctly parsed")
-                    passed += 1
-        else:
-            if result is None:
-                print(f"  PASS: Correctly returned None for invalid input")
-                passed += 1
-            else:
-                print(f"  FAIL: Should have returned None, got {result}")
-                failed += 1
+    if not case["should_pass"]:
+        assert result is None, f"Should have returned None, got {result}"
+        return
 
-    print()
-    print(f"Results: {passed}/{passed + failed} passed")
-    return failed == 0
+    assert result is not None, "Expected valid result, got None"
+    for key, expected_val in case["expected"].items():
+        assert result.get(key) == expected_val, f"{key} = {result.get(key)}, expected {expected_val}"
 
 
 def parse_gemini_response(text: str) -> dict | None:
@@ -122,114 +150,108 @@ def parse_gemini_response(text: str) -> dict | None:
     if not text:
         return None
 
-    text = text.strip()
+    # Bare JSON goes straight to the parser (it skips whitespace itself)
+    if not _is_bare_json_object(text):
+        text = text.strip()
 
-    # Handle markdown code blocks
-    if text.startswith("```"):
-        lines = text.split("\n")
-        # Remove first and last lines (``` markers)
-        text = "\n".join(lines[1:-1])
+        # Handle markdown code blocks
+        fenced = _FENCE_RE.match(text)
+        if fenced:
+            text = fenced.group(1)
 
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return _loads(text)
+    except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
         return None
 
 
-def test_score_conversion():
-    """Test converting LLM response to catalyst score."""
-    print()
-    print("=" * 60)
-    print("TEST: Catalyst Score Conversion")
-    print("=" * 60)
-    print()
-
-    # Test cases: (response, direction, expected_score_range)
-    test_cases = [
-        # High confidence bullish + call = high score
-        {
-            "name": "High confidence bullish call",
-            "response": {
-                "has_catalyst": True,
-                "sentiment": "bullish",
-                "confidence": 0.9,
-                "mention_type": "primary"
-            },
-            "direction": "call",
-            "expected_min": 8.0,
-            "expected_max": 10.0
+# Score cases: response + direction -> expected score range
+SCORE_CASES = [
+    # High confidence bullish + call = high score
+    {
+        "name": "High confidence bullish call",
+        "response": {
+            "has_catalyst": True,
+            "sentiment": "bullish",
+            "confidence": 0.9,
+            "mention_type": "primary"
         },
-        # High confidence bearish + put = high score
-        {
-            "name": "High confidence bearish put",
-            "response": {
-                "has_catalyst": True,
-                "sentiment": "bearish",
-                "confidence": 0.85,
-                "mention_type": "primary"
-            },
-            "direction": "put",
-            "expected_min": 8.0,
-            "expected_max": 10.0
+        "direction": "call",
+        "expected_min": 8.0,
+        "expected_max": 10.0
+    },
+    # High confidence bearish + put = high score
+    {
+        "name": "High confidence bearish put",
+        "response": {
+            "has_catalyst": True,
+            "sentiment": "bearish",
+            "confidence": 0.85,
+            "mention_type": "primary"
         },
-        # Misaligned sentiment = lower score
-        {
-            "name": "Bearish sentiment but call direction",
-            "response": {
-                "has_catalyst": True,
-                "sentiment": "bearish",
-                "confidence": 0.8,
-                "mention_type": "primary"
-            },
-            "direction": "call",
-            "expected_min": 5.0,
-            "expected_max": 7.0
+        "direction": "put",
+        "expected_min": 8.0,
+        "expected_max": 10.0
+    },
+    # Misaligned sentiment = lower score
+    {
+        "name": "Bearish sentiment but call direction",
+        "response": {
+            "has_catalyst": True,
+            "sentiment": "bearish",
+            "confidence": 0.8,
+            "mention_type": "primary"
         },
-        # No catalyst = neutral score
-        {
-            "name": "No catalyst",
-            "response": {
-                "has_catalyst": False,
-                "sentiment": "neutral",
-                "confidence": 0,
-                "mention_type": "passing"
-            },
-            "direction": "call",
-            "expected_min": 4.0,
-            "expected_max": 6.0
+        "direction": "call",
+        "expected_min": 5.0,
+        "expected_max": 7.0
+    },
+    # No catalyst = neutral score
+    {
+        "name": "No catalyst",
+        "response": {
+            "has_catalyst": False,
+            "sentiment": "neutral",
+            "confidence": 0,
+            "mention_type": "passing"
         },
-        # Low confidence = moderate score
-        {
-            "name": "Low confidence",
-            "response": {
-                "has_catalyst": True,
-                "sentiment": "bullish",
-                "confidence": 0.3,
-                "mention_type": "passing"
-            },
-            "direction": "call",
-            "expected_min": 5.0,
-            "expected_max": 7.5
+        "direction": "call",
+        "expected_min": 4.0,
+        "expected_max": 6.0
+    },
+    # Low confidence = moderate score
+    {
+        "name": "Low confidence",
+        "response": {
+            "has_catalyst": True,
+            "sentiment": "bullish",
+            "confidence": 0.3,
+            "mention_type": "passing"
         },
-    ]
+        "direction": "call",
+        "expected_min": 5.0,
+        "expected_max": 7.5
+    },
+]
 
-    passed = 0
-    failed = 0
 
-    for case in test_cases:
-        print(f"[TEST] {case['name']}")
-        score = calculate_catalyst_score(case['response'], case['direction'])
+@pytest.mark.parametrize("case", SCORE_CASES, ids=_case_id)
+def test_score_conversion(case):
+    """Test converting LLM response to catalyst score."""
+    score = calculate_catalyst_score(case["response"], case["direction"])
+    assert case["expected_min"] <= score <= case["expected_max"], (
+        f"Score {score:.1f} NOT in range [{case['expected_min']}, {case['expected_max']}]"
+    )
 
-        if case['expected_min'] <= score <= case['expected_max']:
-            print(f"  PASS: Score {score:.1f} in range [{case['expected_min']}, {case['expected_max']}]")
-            passed += 1
-        else:
-            print(f"  FAIL: Score {score:.1f} NOT in range [{case['expected_min']}, {case['expected_max']}]")
-            failed += 1
 
-    print()
-    print(f"Results: {passed}/{passed + failed} passed")
-    return failed == 0
+# Sentiment/direction pairs that support the trade
+_ALIGNED = {("bullish", "call"): True, ("bearish", "put"): True}.get
+
+# Confidence bands: <0.5, 0.5-0.6, 0.6-0.8, >=0.8
+# (the score only changes at these thresholds, so the band is an exact cache key)
+_CONFIDENCE_BANDS = (0.5, 0.6, 0.8)
+_ALIGNED_BONUS = (0, 1, 1, 3)
+_MISALIGNED_PENALTY_BAND = 2  # confidence >= 0.6
 
 
 def calculate_catalyst_score(response: dict, direction: str) -> float:
@@ -238,92 +260,142 @@ def calculate_catalyst_score(response: dict, direction: str) -> float:
 
     This mirrors the scoring logic in judge.py _score_catalyst()
     """
-    score = 5.0  # Start neutral
-
-    if not response.get("has_catalyst", False):
-        return score
+    band = bisect_right(_CONFIDENCE_BANDS, response.get("confidence", 0))
+    return _score_cached(
+        bool(response.get("has_catalyst", False)), response.get("sentiment", "neutral"), band, direction
+    )
 
-    # Has catalyst (+2 base)
-    score += 2
 
-    # Sentiment alignment
-    sentiment = response.get("sentiment", "neutral")
-    confidence = response.get("confidence", 0)
+@lru_cache(maxsize=1024)
+def _score_cached(has_catalyst: bool, sentiment: str, conf_band: int, direction: str) -> float:
+    """Score a catalyst from hashable, confidence-banded inputs."""
+    if not has_catalyst:
+        return 5.0  # Neutral
 
-    # Check if sentiment aligns with direction
-    aligned = (
-        (sentiment == "bullish" and direction == "call") or
-        (sentiment == "bearish" and direction == "put")
-    )
+    # Has catalyst (+2 base)
+    score = 7.0
 
-    if aligned:
-        if confidence >= 0.8:
-            score += 3
-        elif confidence >= 0.5:
-            score += 1
-    else:
+    if _ALIGNED((sentiment, direction), False):
+        score += _ALIGNED_BONUS[conf_band]
+    elif sentiment != "neutral" and conf_band >= _MISALIGNED_PENALTY_BAND:
         # Misaligned sentiment can reduce score
-        if sentiment != "neutral" and confidence >= 0.6:
-            score -= 1
+        score -= 1
 
     # Clamp
-    return max(0, min(10, score))
+    return 0.0 if score < 0 else 10.0 if score > 10 else score
+
+
+def test_score_batch():
+    """Test batch scoring matches calculate_catalyst_score."""
+    np = pytest.importorskip("numpy")
+    from mike1.core.catalyst_score import score_responses
+
+    responses = []
+    directions = []
+    for has_catalyst in (True, False):
+        for sentiment in ("bullish", "bearish", "neutral", "mixed", None):
+            for confidence in (0.0, 0.3, 0.5, 0.6, 0.79, 0.8, 0.95, 1.0):
+                for direction in ("call", "put"):
+                    response = {"has_catalyst": has_catalyst, "confidence": confidence}
+                    if sentiment is not None:
+                        response["sentiment"] = sentiment
+                    responses.append(response)
+                    directions.append(direction)
+
+    expected = np.array(
+        [calculate_catalyst_score(r, d) for r, d in zip(responses, directions)],
+        dtype=np.float32
+    )
+    actual = score_responses(responses, directions)
 
+    mismatches = np.flatnonzero(~np.isclose(actual, expected))
+    assert mismatches.size == 0, [
+        (responses[i], directions[i], actual[i], expected[i]) for i in mismatches[:5]
+    ]
 
-def test_edge_cases():
+
+EDGE_CASES = [
+    # Missing required fields
+    {
+        "name": "Missing has_catalyst field",
+        "input": '{"sentiment": "bullish", "confidence": 0.5}',
+        "check": lambda r: r is not None and "has_catalyst" not in r
+    },
+    # Confidence out of range (should still parse)
+    {
+        "name": "Confidence > 1.0",
+        "input": '{"has_catalyst": true, "confidence": 1.5, "sentiment": "bullish"}',
+        "check": lambda r: r is not None and r.get("confidence") == 1.5
+    },
+    # Unicode in response
+    {
+        "name": "Unicode characters",
+        "input": '{"has_catalyst": true, "summary": "NVDA \u2014 earnings beat", "sentiment": "bullish", "confidence": 0.7}',
+        "check": lambda r: r is not None and "\u2014" in r.get("summary", "")
+    },
+    # Nested markdown blocks
+    {
+        "name": "Nested code blocks (malformed)",
+        "input": '```json\n```\n{"has_catalyst": true}\n```\n```',
+        "check": lambda r: r is None  # Should fail
+    },
+]
+
+
+@pytest.mark.parametrize("case", EDGE_CASES, ids=_case_id)
+def test_edge_cases(case):
     """Test edge cases and error handling."""
+    result = parse_gemini_response(case["input"])
+    assert case["check"](result), f"Got {result}"
+
+
+def _run_cases(title: str, test, cases: list[dict]) -> bool:
+    """Run one parametrized test over its cases with console output."""
     print()
     print("=" * 60)
-    print("TEST: Edge Cases")
+    print(f"TEST: {title}")
     print("=" * 60)
     print()
 
-    test_cases = [
-        # Missing required fields
-        {
-            "name": "Missing has_catalyst field",
-            "input": '{"sentiment": "bullish", "confidence": 0.5}',
-            "check": lambda r: r is not None and "has_catalyst" not in r
-        },
-        # Confidence out of range (should still parse)
-        {
-            "name": "Confidence > 1.0",
-            "input": '{"has_catalyst": true, "confidence": 1.5, "sentiment": "bullish"}',
-            "check": lambda r: r is not None and r.get("confidence") == 1.5
-        },
-        # Unicode in response
-        {
-            "name": "Unicode characters",
-            "input": '{"has_catalyst": true, "summary": "NVDA \u2014 earnings beat", "sentiment": "bullish", "confidence": 0.7}',
-            "check": lambda r: r is not None and "\u2014" in r.get("summary", "")
-        },
-        # Nested markdown blocks
-        {
-            "name": "Nested code blocks (malformed)",
-            "input": '```json\n```\n{"has_catalyst": true}\n```\n```',
-            "check": lambda r: r is None  # Should fail
-        },
-    ]
-
     passed = 0
     failed = 0
 
-    for case in test_cases:
+    for case in cases:
         print(f"[TEST] {case['name']}")
-        result = parse_gemini_response(case['input'])
-
-        if case['check'](result):
+        try:
+            test(case)
+        except AssertionError as e:
+            print(f"  FAIL: {e}")
+            failed += 1
+        else:
             print(f"  PASS")
             passed += 1
-        else:
-            print(f"  FAIL: Got {result}")
-            failed += 1
 
     print()
     print(f"Results: {passed}/{passed + failed} passed")
     return failed == 0
 
 
+def _run_batch() -> bool:
+    """Run the batch scoring test with console output."""
+    print()
+    print("=" * 60)
+    print("TEST: Batch Catalyst Scoring")
+    print("=" * 60)
+    print()
+
+    try:
+        test_score_batch()
+    except pytest.skip.Exception as e:
+        print(f"  SKIP: {e.msg}")
+    except AssertionError as e:
+        print(f"  FAIL: {e}")
+        return False
+    else:
+        print(f"  PASS")
+    return True
+
+
 if __name__ == "__main__":
     print()
     print("MIKE-1 Gemini Parsing Tests")
@@ -331,9 +403,10 @@ if __name__ == "__main__":
     print()
 
     results = []
-    results.append(("JSON Parsing", test_json_parsing()))
-    results.append(("Score Conversion", test_score_conversion()))
-    results.append(("Edge Cases", test_edge_cases()))
+    results.append(("JSON Parsing", _run_cases("Gemini Response Parsing", test_json_parsing, JSON_CASES)))
+    results.append(("Score Conversion", _run_cases("Catalyst Score Conversion", test_score_conversion, SCORE_CASES)))
+    results.append(("Batch Scoring", _run_batch()))
+    results.append(("Edge Cases", _run_cases("Edge Cases", test_edge_cases, EDGE_CASES)))
 
     print()
     print("=" * 60)
@@ -17,18 +17,27 @@ Usage:
 import argparse
 import sys
 import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from typing import Optional
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 from dotenv import load_dotenv
 load_dotenv()
 
+from mike1.utils.jit import njit
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BacktestTrade:
     """A simulated trade for backtesting."""
     ticker: str
@@ -41,107 +50,338 @@ class BacktestTrade:
     exit_price: Optional[float] = None
     exit_reason: Optional[str] = None
     pnl_pct: float = 0.0
-    high_water_mark: float = 0.0
 
     @property
     def is_winner(self) -> bool:
         return self.pnl_pct > 0
 
 
-@dataclass
+# Grade codes for the results' grade column
+GRADE_CODES = {"A": 0, "B": 1}  # Anything else is NO_TRADE
+NO_TRADE_CODE = 2
+GRADE_LABELS = ("A_TIER", "B_TIER", "NO_TRADE")
+
+
+# Report table formats
+REPORT_HEADER = "{:<12} {:>6} {:>8} {:>10} {:>12} {:>8} {:>8}".format(
+    "Grade", "Count", "Win %", "Avg P&L", "Total P&L", "Best", "Worst"
+)
+REPORT_ROW_FMT = "{:<12} {:>6} {:>7.1f}% {:>9.1f}% {:>11.1f}% {:>7.1f}% {:>7.1f}%"
+REPORT_EMPTY_ROW_FMT = "{:<12} {:>6} " + "{:>8} {:>10} {:>12} {:>8} {:>8}".format(*["--"] * 5)
+
+
+def _strictly_descending(values: tuple) -> bool:
+    """True if each value is greater than the next."""
+    return all(x > y for x, y in zip(values, values[1:]))
+
+
+@dataclass(slots=True)
 class BacktestResults:
-    """Aggregated backtest results."""
+    """
+    Aggregated backtest results.
+
+    Stored as columns (one array per field, one row per trade) so the
+    per-grade stats are vectorized reductions. Arrays double when full.
+    """
     total_trades: int = 0
+    capacity: int = 64
 
-    # By grade
-    a_tier_trades: list = field(default_factory=list)
-    b_tier_trades: list = field(default_factory=list)
-    no_trade_trades: list = field(default_factory=list)
+    pnl_pct: np.ndarray = field(init=False, repr=False)
+    grades: np.ndarray = field(init=False, repr=False)
 
-    def add_trade(self, trade: BacktestTrade):
-        self.total_trades += 1
-        if trade.grade == "A":
-            self.a_tier_trades.append(trade)
-        elif trade.grade == "B":
-            self.b_tier_trades.append(trade)
-        else:
-            self.no_trade_trades.append(trade)
+    def __post_init__(self):
+        self.pnl_pct = np.empty(self.capacity, dtype=np.float64)
+        self.grades = np.empty(self.capacity, dtype=np.int8)
 
-    def _grade_stats(self, trades: list) -> dict:
-        if not trades:
+    def add_trade(self, trade: BacktestTrade):
+        n = self.total_trades
+        if n == self.capacity:
+            self._grow()
+
+        self.pnl_pct[n] = trade.pnl_pct
+        self.grades[n] = GRADE_CODES.get(trade.grade, NO_TRADE_CODE)
+        self.total_trades = n + 1
+
+    def _grow(self):
+        """Double the column capacity."""
+        self.capacity = max(1, self.capacity * 2)
+        for name in ("pnl_pct", "grades"):
+            old = getattr(self, name)
+            new = np.empty(self.capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _grade_stats(self, grade_code: int) -> dict:
+        n = self.total_trades
+        pnls = self.pnl_pct[:n][self.grades[:n] == grade_code]
+
+        if not pnls.size:
             return {"count": 0, "win_rate": 0, "avg_pnl": 0, "total_pnl": 0}
 
-        winners = [t for t in trades if t.is_winner]
-        pnls = [t.pnl_pct for t in trades]
-
         return {
-            "count": len(trades),
-            "win_rate": len(winners) / len(trades) * 100,
-            "avg_pnl": sum(pnls) / len(pnls),
-            "total_pnl": sum(pnls),
-            "best": max(pnls) if pnls else 0,
-            "worst": min(pnls) if pnls else 0,
+            "count": int(pnls.size),
+            "win_rate": float((pnls > 0).mean() * 100),
+            "avg_pnl": float(pnls.mean()),
+            "total_pnl": float(pnls.sum()),
+            "best": float(pnls.max()),
+            "worst": float(pnls.min()),
         }
 
     def summary(self) -> dict:
-        return {
-            "total_trades": self.total_trades,
-            "A_TIER": self._grade_stats(self.a_tier_trades),
-            "B_TIER": self._grade_stats(self.b_tier_trades),
-            "NO_TRADE": self._grade_stats(self.no_trade_trades),
-        }
+        summary = {"total_trades": self.total_trades}
+        for code, label in enumerate(GRADE_LABELS):
+            summary[label] = self._grade_stats(code)
+        return summary
 
     def print_report(self):
         """Print formatted backtest report."""
         s = self.summary()
 
-        print()
-        print("=" * 70)
-        print("JUDGE BACKTEST RESULTS")
-        print("=" * 70)
-        print()
-        print(f"Total Setups Evaluated: {s['total_trades']}")
-        print()
-
-        print(f"{'Grade':<12} {'Count':>6} {'Win %':>8} {'Avg P&L':>10} {'Total P&L':>12} {'Best':>8} {'Worst':>8}")
-        print("-" * 70)
-
-        for grade in ["A_TIER", "B_TIER", "NO_TRADE"]:
+        lines = [
+            "",
+            "=" * 70,
+            "JUDGE BACKTEST RESULTS",
+            "=" * 70,
+            "",
+            f"Total Setups Evaluated: {s['total_trades']}",
+            "",
+            REPORT_HEADER,
+            "-" * 70,
+        ]
+
+        for grade in GRADE_LABELS:
             g = s[grade]
             if g["count"] > 0:
-                print(f"{grade:<12} {g['count']:>6} {g['win_rate']:>7.1f}% {g['avg_pnl']:>9.1f}% {g['total_pnl']:>11.1f}% {g['best']:>7.1f}% {g['worst']:>7.1f}%")
+                lines.append(REPORT_ROW_FMT.format(
+                    grade, g["count"], g["win_rate"], g["avg_pnl"], g["total_pnl"], g["best"], g["worst"]
+                ))
             else:
-                print(f"{grade:<12} {g['count']:>6} {'--':>8} {'--':>10} {'--':>12} {'--':>8} {'--':>8}")
+                lines.append(REPORT_EMPTY_ROW_FMT.format(grade))
 
-        print()
+        lines.append("")
 
-        # Validation: Does A > B > NO_TRADE?
-        a_avg = s["A_TIER"]["avg_pnl"] if s["A_TIER"]["count"] > 0 else float('-inf')
-        b_avg = s["B_TIER"]["avg_pnl"] if s["B_TIER"]["count"] > 0 else float('-inf')
-        no_avg = s["NO_TRADE"]["avg_pnl"] if s["NO_TRADE"]["count"] > 0 else float('-inf')
-
-        print("VALIDATION:")
-        if a_avg > b_avg > no_avg:
-            print("  [PASS] A-TIER > B-TIER > NO_TRADE (as expected)")
-        elif a_avg > b_avg:
-            print("  [PARTIAL] A-TIER > B-TIER (good), but NO_TRADE not worst")
-        elif a_avg > no_avg:
-            print("  [PARTIAL] A-TIER > NO_TRADE, but B-TIER ordering off")
+        # Validation: Does A > B > NO_TRADE?  (grades with no trades rank last)
+        avgs = tuple(s[g]["avg_pnl"] if s[g]["count"] else float('-inf') for g in GRADE_LABELS)
+
+        lines.append("VALIDATION:")
+        if _strictly_descending(avgs):
+            lines.append("  [PASS] A-TIER > B-TIER > NO_TRADE (as expected)")
         else:
-            print("  [FAIL] Grade ordering does not match P&L performance")
-            print(f"         A={a_avg:.1f}% B={b_avg:.1f}% NO={no_avg:.1f}%")
+            ordering = " > ".join(g for _, g in sorted(zip(avgs, GRADE_LABELS), reverse=True))
+            status = "PARTIAL" if avgs[0] > min(avgs[1:]) else "FAIL"
+            lines.append(f"  [{status}] Grade ordering by avg P&L: {ordering}")
+            lines.append("         A={:.1f}% B={:.1f}% NO={:.1f}%".format(*avgs))
 
         # Win rate validation
-        a_wr = s["A_TIER"]["win_rate"] if s["A_TIER"]["count"] > 0 else 0
-        b_wr = s["B_TIER"]["win_rate"] if s["B_TIER"]["count"] > 0 else 0
-        no_wr = s["NO_TRADE"]["win_rate"] if s["NO_TRADE"]["count"] > 0 else 0
+        win_rates = tuple(s[g]["win_rate"] if s[g]["count"] else 0 for g in GRADE_LABELS)
 
-        if a_wr > b_wr > no_wr:
-            print("  [PASS] Win rate: A-TIER > B-TIER > NO_TRADE")
+        if _strictly_descending(win_rates):
+            lines.append("  [PASS] Win rate: A-TIER > B-TIER > NO_TRADE")
         else:
-            print(f"  [INFO] Win rates: A={a_wr:.0f}% B={b_wr:.0f}% NO={no_wr:.0f}%")
+            lines.append("  [INFO] Win rates: A={:.0f}% B={:.0f}% NO={:.0f}%".format(*win_rates))
 
-        print()
+        lines.append("")
+
+        # One write for the whole report
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Simple exit rules for backtesting
+PROFIT_TARGET = 0.25  # +25%
+HARD_STOP = -0.50     # -50%
+
+# Option leverage approximation (delta ~0.35 = 2.5-3x leverage)
+LEVERAGE = 2.5
+
+# Exit reason codes from the simulate_*_days kernels
+EXIT_HARD_STOP = 0
+EXIT_PROFIT_TARGET = 1
+EXIT_EOD_CLOSE = 2
+EXIT_REASONS = ("hard_stop", "profit_target", "eod_close")
+
+# Concurrent grade() calls - network-bound, so threads sharing one Judge
+BACKTEST_WORKERS = 8
+
+
+def get_historical_bars_batch(broker, symbols: list[str], days: int) -> dict[str, list]:
+    """Fetch historical daily bars for several symbols in one Alpaca request."""
+    return _fetch_daily_bars(broker._data_client, tuple(symbols), days, date.today().toordinal())
+
+
+@lru_cache(maxsize=256)
+def _fetch_daily_bars(data_client, symbols: tuple[str, ...], days: int, end_day: int) -> dict[str, list]:
+    """
+    Cached bar fetch - repeated runs in one process (parameter sweeps) reuse
+    the bars. end_day buckets entries by date so they expire the next day.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    from alpaca.data.requests import StockBarsRequest
+    from alpaca.data.timeframe import TimeFrame
+
+    end = datetime.now()
+    start = end - timedelta(days=days + 15)  # Buffer for weekends/holidays
+
+    request = StockBarsRequest(
+        symbol_or_symbols=list(symbols),
+        timeframe=TimeFrame.Day,
+        start=start,
+        end=end
+    )
+
+    bars_data = data_client.get_stock_bars(request)
+
+    # BarSet uses [] access, not 'in' operator
+    out = {}
+    for symbol in symbols:
+        try:
+            out[symbol] = list(bars_data[symbol])
+        except (KeyError, TypeError):
+            out[symbol] = []
+    return out
+
+
+def backtest_ticker(
+    judge,
+    ticker: str,
+    direction: str,
+    bars: list,
+    lookback_days: int
+) -> tuple[list[BacktestTrade], str]:
+    """
+    Backtest a single ticker/direction combo on prefetched daily bars.
+
+    Returns:
+        (trades, status) - status is the one-line progress message
+    """
+    trades = []
+
+    try:
+        if not bars or len(bars) < 3:
+            return trades, f"insufficient data (got {len(bars) if bars else 0} bars)"
+
+        # Each trading day in the lookback window; skip weekends/holidays (no bar)
+        days = [bar for bar in bars[2:lookback_days + 2] if bar is not None]
+
+        # Score with Judge (using current market state - simplified)
+        # In reality, we'd need historical VWAP, RSI, etc. Judge gets no
+        # per-day context, so one verdict applies to every simulated day.
+        verdict = judge.grade(
+            symbol=ticker,
+            direction=direction,
+            strike=None,  # ATM
+            expiration=None  # Default
+        )
+
+        if verdict is None:
+            return trades, "0 setups"
+
+        grade = verdict.grade.value[0]  # "A", "B", or "N"
+
+        # Entry at each day's open, high/low/close for the outcome
+        n = len(days)
+        opens, highs, lows, closes = (
+            np.fromiter(map(attrgetter(name), days), dtype=np.float64, count=n)
+            for name in ("open", "high", "low", "close")
+        )
+
+        # One specialized kernel per direction - no per-day direction branch
+        simulate = simulate_call_days if direction == "call" else simulate_put_days
+        pnl_pct, exit_codes = simulate(opens, highs, lows, closes, LEVERAGE, PROFIT_TARGET, HARD_STOP)
+
+        # Bars in one response share a schema - resolve the timestamp source once
+        if days and hasattr(days[0], 'timestamp'):
+            get_entry_time = attrgetter('timestamp')
+        else:
+            now = datetime.now()
+            get_entry_time = lambda bar: now
+
+        for i, bar in enumerate(days):
+            trades.append(BacktestTrade(
+                ticker=ticker,
+                direction=direction,
+                grade=grade,
+                score=verdict.score,
+                entry_time=get_entry_time(bar),
+                entry_price=bar.open,
+                exit_reason=EXIT_REASONS[exit_codes[i]],
+                pnl_pct=float(pnl_pct[i]),
+            ))
+
+        return trades, f"{len(trades)} setups"
+
+    except Exception as e:
+        return trades, f"error: {e}"
+
+
+@njit(cache=True)
+def _resolve_exit(max_gain, max_loss, close_pnl, profit_target, hard_stop):
+    """Pick one day's exit - returns (exit_reason_code, pnl_pct)."""
+    # Order matters - stop checked first
+    if max_loss <= hard_stop:
+        return EXIT_HARD_STOP, hard_stop * 100
+    if max_gain >= profit_target:
+        return EXIT_PROFIT_TARGET, profit_target * 100
+    return EXIT_EOD_CLOSE, close_pnl * 100
+
+
+@njit(cache=True)
+def simulate_call_days(opens, highs, lows, closes, leverage, profit_target, hard_stop):
+    """
+    Simulate CALL outcomes for every day from daily OHLC arrays.
+
+    Calls profit from up moves. Simplified: the day's high/low decide
+    whether targets hit.
+
+    Returns:
+        (pnl_pct, exit_reason_code) arrays, one entry per day
+    """
+    n = opens.shape[0]
+    pnl_pct = np.empty(n, dtype=np.float64)
+    exit_reason = np.empty(n, dtype=np.int8)
+
+    for i in range(n):
+        entry = opens[i]
+        code, pnl = _resolve_exit(
+            (highs[i] - entry) / entry * leverage,
+            (lows[i] - entry) / entry * leverage,
+            (closes[i] - entry) / entry * leverage,
+            profit_target,
+            hard_stop,
+        )
+        exit_reason[i] = code
+        pnl_pct[i] = pnl
+
+    return pnl_pct, exit_reason
+
+
+@njit(cache=True)
+def simulate_put_days(opens, highs, lows, closes, leverage, profit_target, hard_stop):
+    """
+    Simulate PUT outcomes for every day from daily OHLC arrays.
+
+    Puts profit from down moves. Simplified: the day's high/low decide
+    whether targets hit.
+
+    Returns:
+        (pnl_pct, exit_reason_code) arrays, one entry per day
+    """
+    n = opens.shape[0]
+    pnl_pct = np.empty(n, dtype=np.float64)
+    exit_reason = np.empty(n, dtype=np.int8)
+
+    for i in range(n):
+        entry = opens[i]
+        code, pnl = _resolve_exit(
+            (entry - lows[i]) / entry * leverage,
+            (entry - highs[i]) / entry * leverage,
+            (entry - closes[i]) / entry * leverage,
+            profit_target,
+            hard_stop,
+        )
+        exit_reason[i] = code
+        pnl_pct[i] = pnl
+
+    return pnl_pct, exit_reason
 
 
 class JudgeBacktester:
@@ -154,45 +394,18 @@ class JudgeBacktester:
         - +25% (winner)
         - -50% (hard stop)
         - End of day (time exit)
-    """
 
-    # Simple exit rules for backtesting
-    PROFIT_TARGET = 0.25  # +25%
-    HARD_STOP = -0.50     # -50%
+    Ticker/direction pairs run in a thread pool sharing the broker and
+    judge passed in. Use parallel=False to run them one at a time.
+    """
 
-    def __init__(self, broker, judge, lookback_days: int = 5):
+    def __init__(self, broker, judge, lookback_days: int = 5, parallel: bool = True):
         self.broker = broker
         self.judge = judge
         self.lookback_days = lookback_days
+        self.parallel = parallel
         self.results = BacktestResults()
-
-    def _get_historical_bars(self, symbol: str, days: int):
-        """Fetch historical daily bars from Alpaca."""
-        from alpaca.data.requests import StockBarsRequest
-        from alpaca.data.timeframe import TimeFrame
-
-        end = datetime.now()
-        start = end - timedelta(days=days + 15)  # Buffer for weekends/holidays
-
-        request = StockBarsRequest(
-            symbol_or_symbols=symbol,
-            timeframe=TimeFrame.Day,
-            start=start,
-            end=end
-        )
-
-        try:
-            bars_data = self.broker._data_client.get_stock_bars(request)
-
-            # BarSet uses [] access, not 'in' operator
-            try:
-                bar_list = list(bars_data[symbol])
-                return bar_list
-            except (KeyError, TypeError):
-                return []
-        except Exception as e:
-            print(f"[bars error: {e}]", end=" ")
-            return []
+        self._bars_cache: dict[str, list] = {}
 
     def run(self, tickers: list[str], directions: list[str] = None):
         """
@@ -211,147 +424,63 @@ class JudgeBacktester:
         print(f"Directions: {directions}")
         print()
 
-        for ticker in tickers:
-            for direction in directions:
-                self._backtest_ticker(ticker, direction)
+        # Bars are per ticker - fetch each once, shared by both directions
+        self._prefetch_bars(tickers)
+        bars = self._bars_cache
 
-        return self.results
+        pairs = [(ticker, direction) for ticker in tickers for direction in directions]
 
-    def _backtest_ticker(self, ticker: str, direction: str):
-        """Backtest a single ticker/direction combo."""
-        print(f"  Testing {ticker} {direction}...", end=" ")
-
-        try:
-            # Get historical daily bars
-            bars = self._get_historical_bars(ticker, self.lookback_days + 5)
-
-            if not bars or len(bars) < 3:
-                print(f"insufficient data (got {len(bars) if bars else 0} bars)")
-                return
-
-            # For each trading day, simulate entry at open
-            trades_found = 0
-            for i in range(2, min(len(bars), self.lookback_days + 2)):
-                bar = bars[i]
-                prev_bar = bars[i-1]
-
-                # Skip weekends/holidays (no bar)
-                if bar is None:
-                    continue
-
-                # Create a "snapshot" market state for that day
-                # We'll use the day's open as entry, high/low for outcome
-                entry_price = bar.open
-                day_high = bar.high
-                day_low = bar.low
-                day_close = bar.close
-
-                # Score with Judge (using current market state - simplified)
-                # In reality, we'd need historical VWAP, RSI, etc.
-                verdict = self.judge.grade(
-                    symbol=ticker,
-                    direction=direction,
-                    strike=None,  # ATM
-                    expiration=None  # Default
+        if not self.parallel or len(pairs) <= 1:
+            for ticker, direction in pairs:
+                trades, status = backtest_ticker(
+                    self.judge, ticker, direction, bars[ticker], self.lookback_days
                 )
+                self._record(ticker, direction, trades, status)
+            return self.results
+
+        max_workers = min(len(pairs), BACKTEST_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(
+                    backtest_ticker, self.judge, ticker, direction, bars[ticker], self.lookback_days
+                ): (ticker, direction)
+                for ticker, direction in pairs
+            }
+            for future in as_completed(futures):
+                ticker, direction = futures[future]
+                try:
+                    trades, status = future.result()
+                except Exception as e:
+                    trades, status = [], f"error: {e}"
+                self._record(ticker, direction, trades, status)
 
-                if verdict is None:
-                    continue
-
-                # Simulate intraday outcome based on direction
-                trade = self._simulate_trade(
-                    ticker=ticker,
-                    direction=direction,
-                    grade=verdict.grade.value[0],  # "A", "B", or "N"
-                    score=verdict.score,
-                    entry_time=bar.timestamp if hasattr(bar, 'timestamp') else datetime.now(),
-                    entry_price=entry_price,
-                    day_high=day_high,
-                    day_low=day_low,
-                    day_close=day_close
-                )
-
-                self.results.add_trade(trade)
-                trades_found += 1
+        return self.results
 
-            print(f"{trades_found} setups")
+    def _prefetch_bars(self, tickers: list[str]):
+        """Fetch daily bars for all uncached tickers in a single request."""
+        missing = [t for t in dict.fromkeys(tickers) if t not in self._bars_cache]
+        if not missing:
+            return
 
+        try:
+            self._bars_cache.update(
+                get_historical_bars_batch(self.broker, missing, self.lookback_days + 5)
+            )
         except Exception as e:
-            print(f"error: {e}")
-
-    def _simulate_trade(
-        self,
-        ticker: str,
-        direction: str,
-        grade: str,
-        score: float,
-        entry_time: datetime,
-        entry_price: float,
-        day_high: float,
-        day_low: float,
-        day_close: float
-    ) -> BacktestTrade:
-        """
-        Simulate a trade outcome based on intraday price action.
+            print(f"  [bars error: {e}]")
+            self._bars_cache.update(dict.fromkeys(missing, []))
 
-        For CALL: profit if price goes up
-        For PUT: profit if price goes down
-
-        Simplified: Use day's high/low to determine if targets hit
-        """
-        trade = BacktestTrade(
-            ticker=ticker,
-            direction=direction,
-            grade=grade,
-            score=score,
-            entry_time=entry_time,
-            entry_price=entry_price,
-        )
-
-        if direction == "call":
-            # Call profits from up moves
-            max_gain = (day_high - entry_price) / entry_price
-            max_loss = (day_low - entry_price) / entry_price
-            close_pnl = (day_close - entry_price) / entry_price
-
-            # Option leverage approximation (delta ~0.35 = 2.5-3x leverage)
-            leverage = 2.5
-            max_gain *= leverage
-            max_loss *= leverage
-            close_pnl *= leverage
-
-        else:  # put
-            # Put profits from down moves
-            max_gain = (entry_price - day_low) / entry_price
-            max_loss = (entry_price - day_high) / entry_price
-            close_pnl = (entry_price - day_close) / entry_price
-
-            leverage = 2.5
-            max_gain *= leverage
-            max_loss *= leverage
-            close_pnl *= leverage
-
-        trade.high_water_mark = max_gain
-
-        # Determine outcome (order matters - stop checked first)
-        if max_loss <= self.HARD_STOP:
-            trade.exit_reason = "hard_stop"
-            trade.pnl_pct = self.HARD_STOP * 100
-        elif max_gain >= self.PROFIT_TARGET:
-            trade.exit_reason = "profit_target"
-            trade.pnl_pct = self.PROFIT_TARGET * 100
-        else:
-            trade.exit_reason = "eod_close"
-            trade.pnl_pct = close_pnl * 100
-
-        return trade
+    def _record(self, ticker: str, direction: str, trades: list[BacktestTrade], status: str):
+        """Add one pair's trades to the results and print its progress line."""
+        for trade in trades:
+            self.results.add_trade(trade)
+        print(f"  Testing {ticker} {direction}... {status}")
 
 
 def run_backtest(days: int = 5, ticker: str = None):
     """Run the full backtest."""
     from mike1.modules.broker_factory import BrokerFactory
     from mike1.modules.judge import Judge
-    from mike1.modules.llm_client import get_llm_client
 
     # Connect to broker
     print("Connecting to Alpaca...")
@@ -396,44 +525,42 @@ def run_from_db():
 
     print("Fetching historical trades from database...")
 
-    conn = psycopg2.connect(db_url)
-    cursor = conn.cursor()
-
-    # Get completed trades with grades
-    cursor.execute("""
-        SELECT
-            grade,
-            COUNT(*) as count,
-            COUNT(*) FILTER (WHERE realized_pnl > 0) as wins,
-            ROUND(AVG(pnl_percent)::numeric, 2) as avg_pnl,
-            ROUND(SUM(realized_pnl)::numeric, 2) as total_pnl
-        FROM trades
-        WHERE exit_time IS NOT NULL
-          AND grade IS NOT NULL
-        GROUP BY grade
-        ORDER BY grade
-    """)
-
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
-
-    if not rows:
-        print("No completed trades found in database")
-        return False
+    # Server-side cursor streams rows instead of buffering the whole result;
+    # closing() guarantees the connection is released on error
+    with closing(psycopg2.connect(db_url)) as conn, conn.cursor(name="trades_by_grade") as cursor:
+        cursor.itersize = 1000
+
+        # Get completed trades with grades
+        cursor.execute("""
+            SELECT
+                grade,
+                COUNT(*) as count,
+                COUNT(*) FILTER (WHERE realized_pnl > 0) as wins,
+                100.0 * COUNT(*) FILTER (WHERE realized_pnl > 0) / COUNT(*) as win_pct,
+                ROUND(AVG(pnl_percent)::numeric, 2) as avg_pnl,
+                ROUND(SUM(realized_pnl)::numeric, 2) as total_pnl
+            FROM trades
+            WHERE exit_time IS NOT NULL
+              AND grade IS NOT NULL
+            GROUP BY grade
+            ORDER BY grade
+        """)
+
+        first = cursor.fetchone()
+        if first is None:
+            print("No completed trades found in database")
+            return False
 
-    print()
-    print("=" * 60)
-    print("ACTUAL TRADE PERFORMANCE BY GRADE")
-    print("=" * 60)
-    print()
-    print(f"{'Grade':<10} {'Count':>6} {'Wins':>6} {'Win %':>8} {'Avg P&L':>10} {'Total P&L':>12}")
-    print("-" * 60)
+        print()
+        print("=" * 60)
+        print("ACTUAL TRADE PERFORMANCE BY GRADE")
+        print("=" * 60)
+        print()
+        print(f"{'Grade':<10} {'Count':>6} {'Wins':>6} {'Win %':>8} {'Avg P&L':>10} {'Total P&L':>12}")
+        print("-" * 60)
 
-    for row in rows:
-        grade, count, wins, avg_pnl, total_pnl = row
-        win_pct = (wins / count * 100) if count > 0 else 0
-        print(f"{grade:<10} {count:>6} {wins:>6} {win_pct:>7.1f}% {avg_pnl or 0:>9.1f}% ${total_pnl or 0:>10.2f}")
+        for grade, count, wins, win_pct, avg_pnl, total_pnl in chain((first,), cursor):
+            print(f"{grade:<10} {count:>6} {wins:>6} {win_pct:>7.1f}% {avg_pnl or 0:>9.1f}% ${total_pnl or 0:>10.2f}")
 
     print()
     return True
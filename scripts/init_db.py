@@ -38,19 +38,15 @@ def main():
     try:
         import psycopg2
 
-        # Read schema
-        schema_path = Path(__file__).parent.parent / "db" / "schema.sql"
-        with open(schema_path, 'r') as f:
-            schema_sql = f.read()
-
-        # Connect and execute
+        # Connect first - no point reading the schema if this fails
         conn = psycopg2.connect(database_url)
         cur = conn.cursor()
 
         print("Connected to database")
         print("Executing schema...")
 
-        cur.execute(schema_sql)
+        schema_path = Path(__file__).parent.parent / "db" / "schema.sql"
+        cur.execute(schema_path.read_text(encoding="utf-8"))
         conn.commit()
 
         print("Schema created successfully!")